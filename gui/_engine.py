@@ -25,8 +25,9 @@ Architecture
 2. Procedural backend (no classes/objects)
    - A backend is a ``BackendFns`` mapping of required function names to
      callables: load/generate I/O, ``init_state`` and ``simulate_step``.
-   - ``make_default_backend()`` wires to ``phase1.io_mod`` and
-     ``phase1.sim_mod`` so students can run without writing their own backend.
+   - ``make_default_backend()`` copies ``phase1.phase1.backend`` (wired to
+     ``phase1.io_mod`` and ``phase1.sim_mod``) so students can run without
+     writing their own backend.
 
 3. Adapter layer
    - ``_adapter_*`` functions translate UI input into backend calls and collect
@@ -204,22 +205,14 @@ class BackendFns(TypedDict):
 
 
 def make_default_backend() -> BackendFns:
-    """Return a backend mapping wired to ``phase1.io_mod``/``sim_mod``.
+    """Return a copy of the canonical ``phase1.phase1.backend`` mapping.
 
     The returned mapping exposes the procedural functions expected by this UI,
     allowing students to run the app without writing a custom backend.
     """
-    from phase1 import io_mod
-    from phase1 import sim_mod
-
-    return BackendFns(
-        load_drivers=io_mod.load_drivers,
-        load_requests=io_mod.load_requests,
-        generate_drivers=io_mod.generate_drivers,
-        generate_requests=io_mod.generate_requests,
-        init_state=sim_mod.init_state,
-        simulate_step=sim_mod.simulate_step,
-    )
+    from phase1.phase1 import backend
+
+    return BackendFns(**backend)
 
 
 # ---------------------------------------------------------------------------
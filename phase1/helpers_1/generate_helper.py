@@ -1,6 +1,11 @@
 import random
 import math
-from typing import Any, Union, Tuple, Dict
+from typing import Any, Tuple, Dict, List
+
+
+# Knuth's product of uniforms underflows for large rates (exp(-rate) -> 0), so
+# larger rates are sampled as a sum of Poisson draws of at most this size
+KNUTH_MAX_RATE = 30.0
 
 
 def generate_request_count(req_rate: float) -> int:
@@ -12,55 +17,82 @@ def generate_request_count(req_rate: float) -> int:
     if req_rate == 0:
         return 0
     
+    # Large rates: Poisson(a + b) = Poisson(a) + Poisson(b), so sum chunks Knuth handles exactly
+    if req_rate > KNUTH_MAX_RATE:
+        chunks, rest = divmod(req_rate, KNUTH_MAX_RATE)
+        total = 0
+        for _ in range(int(chunks)):
+            total += generate_request_count(KNUTH_MAX_RATE)
+        return total + generate_request_count(rest)
+    
     # Knuth's algorithm
     L = math.exp(-req_rate)
     k = 0
     p = 1.0
+    rand = random.random  # local lookup in the sampling loop; still honours seed/patch
     
     while p > L:
         k += 1
-        p *= random.random()
+        p *= rand()
     
     return k - 1
 
 
-def create_random_position(width: float, height: float) -> Tuple[float, float]:
-    """Generate a random (x, y) position within grid bounds. """
-    x = random.uniform(0, width)
-    y = random.uniform(0, height)
-    return (x, y)
+# Fixed-layout driver record, copied per driver like _REQUEST_TEMPLATE below
+_DRIVER_TEMPLATE: Dict[str, Any] = {
+    "id": None,
+    "x": 0.0,
+    "y": 0.0,
+    "speed": 0.0,
+    "vx": 0.0,
+    "vy": 0.0,
+    "target_id": None,
+    "tx": None,
+    "status": "idle",
+    "request_id": None
+}
 
 
-def create_driver_dict(driver_id: int, width: float, height: float) -> Dict[str, Any]:
-    """Create a driver dict with random position and speed."""
-    x, y = create_random_position(width, height)
-    speed = random.uniform(0.8, 1.6)
-    
-    return {
-        "id": driver_id,
-        "x": x,
-        "y": y,
-        "speed": speed,
-        "vx": 0.0,
-        "vy": 0.0,
-        "target_id": None
-    }
+def create_driver_dicts(positions: List[Tuple[float, float]]) -> List[Dict[str, Any]]:
+    """Create one driver dict per position, ids 0..n-1, drawing all speeds in one loop."""
+    rand = random.random
+    drivers = []
+    for driver_id, (x, y) in enumerate(positions):
+        driver = _DRIVER_TEMPLATE.copy()
+        driver["id"] = driver_id
+        driver["x"] = x
+        driver["y"] = y
+        # Same draw as random.uniform(0.8, 1.6), without the extra call
+        driver["speed"] = 0.8 + 0.8 * rand()
+        drivers.append(driver)
+    return drivers
 
 
-def create_request_dict(request_id: Union[int, str], time: int, width: float, 
-                       height: float) -> Dict[str, Any]:
-    """Create a request dict with random pickup/dropoff and time."""
-    px, py = create_random_position(width, height)
-    dx, dy = create_random_position(width, height)
-    
-    return {
-        "id": request_id,
-        "t": time,
-        "px": px,
-        "py": py,
-        "dx": dx,
-        "dy": dy,
-        "status": "waiting",
-        "driver_id": None,
-        "t_wait": 0
-    }
+# Fixed-layout request record; copying it is cheaper than building a new dict literal
+_REQUEST_TEMPLATE: Dict[str, Any] = {
+    "id": None,
+    "t": 0,
+    "px": 0.0,
+    "py": 0.0,
+    "dx": 0.0,
+    "dy": 0.0,
+    "status": "waiting",
+    "driver_id": None,
+    "t_wait": 0
+}
+
+
+def create_request_dicts(n: int, time: int, width: float, height: float) -> List[Dict[str, Any]]:
+    """Create n request dicts for one tick, ids "{time}_{i}", drawing all coordinates in one loop."""
+    rand = random.random
+    requests = []
+    for i in range(n):
+        request = _REQUEST_TEMPLATE.copy()
+        request["id"] = f"{time}_{i}"
+        request["t"] = time
+        request["px"] = rand() * width
+        request["py"] = rand() * height
+        request["dx"] = rand() * width
+        request["dy"] = rand() * height
+        requests.append(request)
+    return requests
@@ -1,5 +1,6 @@
 import os
-from typing import Any
+import mmap
+from typing import Any, Iterable, Iterator
 
 
 def file_exists(path: str) -> None:
@@ -10,23 +11,36 @@ def file_exists(path: str) -> None:
 
 def parse_csv_line(line: str) -> list[str]:
     """Parse a CSV line into a list of fields."""
-    fields = [field.strip() for field in line.split(',')]
-    return [f for f in fields if f]
+    # Strip and drop empty fields in one loop (no intermediate list)
+    fields = []
+    for field in line.split(','):
+        field = field.strip()
+        if field:
+            fields.append(field)
+    return fields
 
 
-def read_csv_lines(path: str) -> list[str]:
-    """Read all non-comment lines from a CSV file."""
+def iter_csv_bytes(path: str) -> Iterator[bytes]:
+    """Yield stripped non-comment lines of a CSV file as bytes, streamed from a memory map."""
     file_exists(path)
-    
-    lines = []
-    with open(path, 'r', encoding='utf-8') as f:
-        for line in f:
+
+    # mmap cannot map an empty file
+    if os.path.getsize(path) == 0:
+        return
+
+    # Read lines from a read-only memory map instead of buffered text reads;
+    # mmap.readline finds each newline and slices in C
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for line in iter(mm.readline, b''):
             line = line.strip()
             # Skip comments and empty lines
-            if line and not line.startswith('#'):
-                lines.append(line)
-    
-    return lines
+            if line and not line.startswith(b'#'):
+                yield line
+
+
+def read_csv_lines(path: str) -> list[str]:
+    """Read all non-comment lines from a CSV file."""
+    return [line.decode('utf-8') for line in iter_csv_bytes(path)]
 
 
 def parse_float(value: str, field_name: str, line_num: int) -> float:
@@ -39,6 +53,16 @@ def parse_float(value: str, field_name: str, line_num: int) -> float:
         )
 
 
+def parse_int_time(value: str, line_num: int) -> int:
+    """Parse a string as integer tick time, raise ValueError on failure (decimals included)."""
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(
+            f"Line {line_num}: Time 't' must be an integer, got '{value}'"
+        )
+
+
 def validate_coordinate(value: float, field_name: str, line_num: int, min_val: float = 0, max_val: float = 50) -> float:
     """Validate coordinate is within bounds."""
     if not (min_val <= value <= max_val):
@@ -73,8 +97,11 @@ def parse_driver_row(row: list[str], line_num: int) -> dict[str, Any]:
     x = parse_float(row[0], 'x', line_num)
     y = parse_float(row[1], 'y', line_num)
     
-    x = validate_coordinate(x, 'x', line_num)
-    y = validate_coordinate(y, 'y', line_num)
+    # Bounds checks inlined (same messages as validate_coordinate) to skip a call per field
+    if not (0 <= x <= 50):
+        raise ValueError(f"Line {line_num}: 'x' = {x} is out of bounds [0, 50]")
+    if not (0 <= y <= 50):
+        raise ValueError(f"Line {line_num}: 'y' = {y} is out of bounds [0, 50]")
     
     return {
         "x": x,
@@ -86,26 +113,93 @@ def parse_driver_row(row: list[str], line_num: int) -> dict[str, Any]:
     }
 
 
+def parse_driver_rows(lines: Iterable[str | bytes], sep: str | bytes = ',') -> list[dict[str, Any]] | None:
+    """Parse all driver lines in one pass without per-field helper calls.
+    Lines may be str or bytes (with a matching sep); float() accepts both.
+    Returns None if any row is invalid so the caller can rerun the per-row
+    path and report the exact error."""
+    drivers: list[dict[str, Any]] = []
+    try:
+        for line in lines:
+            # Plain split: float() tolerates the surrounding spaces, and rows with
+            # empty fields fail here and are left to the per-row path
+            row = line.split(sep)
+            x = float(row[0])
+            y = float(row[1])
+            if not (0 <= x <= 50 and 0 <= y <= 50):
+                return None
+            drivers.append({
+                "x": x,
+                "y": y,
+                "speed": 1.0,
+                "vx": 0.0,
+                "vy": 0.0,
+                "target_id": None,
+                "id": len(drivers),
+            })
+    except (ValueError, IndexError):
+        return None
+    return drivers
+
+
 def parse_request_row(row: list[str], line_num: int) -> dict[str, Any]:
     """Parse and validate a request row from CSV."""
     validate_row_length(row, 5, line_num, 'request')
     
-    t = parse_float(row[0], 't', line_num)
+    t = parse_int_time(row[0], line_num)
     px = parse_float(row[1], 'px', line_num)
     py = parse_float(row[2], 'py', line_num)
     dx = parse_float(row[3], 'dx', line_num)
     dy = parse_float(row[4], 'dy', line_num)
     
     t = validate_time(t, line_num)
-    px = validate_coordinate(px, 'px', line_num)
-    py = validate_coordinate(py, 'py', line_num)
-    dx = validate_coordinate(dx, 'dx', line_num)
-    dy = validate_coordinate(dy, 'dy', line_num)
+    # Bounds checks inlined (same messages as validate_coordinate) to skip a call per field
+    if not (0 <= px <= 50):
+        raise ValueError(f"Line {line_num}: 'px' = {px} is out of bounds [0, 50]")
+    if not (0 <= py <= 50):
+        raise ValueError(f"Line {line_num}: 'py' = {py} is out of bounds [0, 50]")
+    if not (0 <= dx <= 50):
+        raise ValueError(f"Line {line_num}: 'dx' = {dx} is out of bounds [0, 50]")
+    if not (0 <= dy <= 50):
+        raise ValueError(f"Line {line_num}: 'dy' = {dy} is out of bounds [0, 50]")
     
     return {
-        "t": int(t),
+        "t": t,
         "px": px,
         "py": py,
         "dx": dx,
         "dy": dy
     }
+
+
+def parse_request_rows(lines: Iterable[str | bytes], sep: str | bytes = ',') -> list[dict[str, Any]] | None:
+    """Parse all request lines in one pass without per-field helper calls.
+    Lines may be str or bytes (with a matching sep); int()/float() accept both.
+    Returns None if any row is invalid so the caller can rerun the per-row
+    path and report the exact error."""
+    requests: list[dict[str, Any]] = []
+    try:
+        for idx, line in enumerate(lines):
+            # Plain split: int()/float() tolerate the surrounding spaces, and rows
+            # with empty fields fail here and are left to the per-row path
+            row = line.split(sep)
+            t = int(row[0])
+            px = float(row[1])
+            py = float(row[2])
+            dx = float(row[3])
+            dy = float(row[4])
+            # Written as "not (in range)" so NaN is rejected too
+            if not (t >= 0 and 0 <= px <= 50 and 0 <= py <= 50
+                    and 0 <= dx <= 50 and 0 <= dy <= 50):
+                return None
+            requests.append({
+                "id": idx,
+                "t": t,
+                "px": px,
+                "py": py,
+                "dx": dx,
+                "dy": dy,
+            })
+    except (ValueError, IndexError):
+        return None
+    return requests
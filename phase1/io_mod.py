@@ -1,22 +1,31 @@
 import random
 
 from .helpers_1.load_helper import (
+    iter_csv_bytes,
     read_csv_lines,
     parse_csv_line,
     parse_driver_row,
+    parse_driver_rows,
     parse_request_row,
+    parse_request_rows,
 )
 from .helpers_1.generate_helper import (
     generate_request_count,
-    create_driver_dict,
-    create_request_dict,
+    create_driver_dicts,
+    create_request_dicts,
 )
 
 def load_drivers(path: str) -> list[dict]:
     """Load drivers from a CSV file."""
 
-    rows = read_csv_lines(path)
+    # Fast path: rows streamed as bytes from the file and parsed in one pass
+    # (no per-line str objects) when every row is valid
+    fast = parse_driver_rows(iter_csv_bytes(path), sep=b',')
+    if fast is not None:
+        return fast
 
+    # Per-row path reports exactly which line is invalid
+    rows = read_csv_lines(path)
     drivers: list[dict] = []
     for line_num, line in enumerate(rows, start=2):
         row = parse_csv_line(line)
@@ -33,9 +42,14 @@ def load_drivers(path: str) -> list[dict]:
 def load_requests(path: str) -> list[dict]:
     """Load requests from a CSV file. ests CSV."""
 
-    rows = read_csv_lines(path)
-
+    # Fast path: rows streamed as bytes from the file, parsed and bounds-checked
+    # in one pass (no per-line str objects) when every row is valid
+    fast = parse_request_rows(iter_csv_bytes(path), sep=b',')
+    if fast is not None:
+        return fast
 
+    # Per-row path reports exactly which line is invalid
+    rows = read_csv_lines(path)
     try:
         requests: list[dict] = []
         for idx, line in enumerate(rows):
@@ -44,7 +58,8 @@ def load_requests(path: str) -> list[dict]:
             if not row:
                 continue
             req = parse_request_row(row, line_num)
-            requests.append({"id": idx, **req})
+            req["id"] = idx  # set in place rather than copying into a new dict
+            requests.append(req)
     except Exception as exc:
         print(f"Error processing requests from {path}: {exc}")
         raise
@@ -60,28 +75,18 @@ def generate_drivers(n: int, width: int, height: int) -> list[dict]:
     if n < 0:
         raise ValueError(f"Number of drivers must be non-negative, got {n}")
     
-    drivers: list[dict] = []
-    used_positions: set[tuple[int, int]] = set()
-
-    for driver_id in range(n):
-        while True:
-            x = random.randint(0, max(0, width - 1))
-            y = random.randint(0, max(0, height - 1))
-            pos = (x, y)
-            if pos in used_positions:
-                continue
-            used_positions.add(pos)
-            driver = create_driver_dict(driver_id, width, height)
-            driver["x"] = float(x)
-            driver["y"] = float(y)
-            driver.setdefault("vy", 0.0)
-            driver.setdefault("tx", None)
-            driver.setdefault("status", "idle")
-            driver.setdefault("request_id", None)
-            drivers.append(driver)
-            break
+    cols = max(1, int(width))
+    rows = max(1, int(height))
+    if n > cols * rows:
+        raise ValueError(f"Cannot place {n} drivers on distinct cells of a {cols}x{rows} grid")
 
-    return drivers
+    # Draw n distinct grid cells at once instead of rejection-sampling collisions
+    cells = random.sample(range(cols * rows), n)
+
+    positions = [(float(cell % cols), float(cell // cols)) for cell in cells]
+
+    # Build every driver in one batch instead of one helper call each
+    return create_driver_dicts(positions)
 
 
 def generate_requests(start_t: int, out_list: list[dict], req_rate: float,width: int, height: int) -> None:
@@ -91,9 +96,5 @@ def generate_requests(start_t: int, out_list: list[dict], req_rate: float,width:
     
     num_requests = generate_request_count(req_rate)
 
-    for i in range(num_requests):
-        request = create_request_dict(f"{start_t}_{i}", start_t, width, height)
-        request.setdefault("status", "waiting")
-        request.setdefault("driver_id", None)
-        request.setdefault("t_wait", 0)
-        out_list.append(request)
\ No newline at end of file
+    # Build the whole tick's requests in one batch instead of one helper call each
+    out_list.extend(create_request_dicts(num_requests, start_t, width, height))
\ No newline at end of file
@@ -1,5 +1,5 @@
-import io_mod
-import sim_mod
+from . import io_mod
+from . import sim_mod
 
 # Backend dictionary for central function access
 backend = {
@@ -1,11 +1,15 @@
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
 
-# Initialize Phase 2 backend
-try:
-    from phase2 import adapter as phase2_adapter
-    _phase2_backend = phase2_adapter.create_phase2_backend()
-except ImportError as e:
-    raise ImportError(f"Phase 2 engine required: {e}")
+
+@lru_cache(maxsize=1)
+def _get_backend() -> Dict[str, Callable]:
+    """Create the Phase 2 backend on first use and reuse it for the rest of the process."""
+    try:
+        from phase2 import adapter as phase2_adapter
+    except ImportError as e:
+        raise ImportError(f"Phase 2 engine required: {e}")
+    return phase2_adapter.create_phase2_backend()
 
 
 def init_state(
@@ -17,12 +21,7 @@ def init_state(
     height: int = 30
 ) -> Dict[str, Any]:
     """Initialize the simulation with drivers, requests, and configuration parameters."""
-    if _phase2_backend is None:
-        raise RuntimeError(
-            "Phase 2 backend not initialized. Check import errors above."
-        )
-    
-    return _phase2_backend["init_state"](
+    return _get_backend()["init_state"](
         drivers_data=drivers,
         requests_data=requests,
         timeout=timeout,
@@ -34,9 +33,4 @@ def init_state(
 
 def simulate_step(state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """Advance simulation by one tick."""
-    if _phase2_backend is None:
-        raise RuntimeError(
-            "Phase 2 backend not initialized. Check import errors above."
-        )
-    
-    return _phase2_backend["simulate_step"](state)
+    return _get_backend()["simulate_step"](state)
@@ -15,38 +15,14 @@ from .helpers_2.engine_helpers import (
     create_driver_from_dict,    
     create_request_from_dict,    
     request_to_dict,             
-    get_plot_data_from_state,    
+    get_plot_data_from_simulation,
 )
 from .helpers_2.metrics_helpers import SimulationTimeSeries
 
 
-# ====================================================================
-# Module-level simulation state
-# ====================================================================
-
-_simulation: DeliverySimulation | None = None
-_time_series: SimulationTimeSeries | None = None  # Track metrics for post-simulation reporting
-
-
-# ====================================================================
-# Adapter functions (called by GUI)
-# ====================================================================
-
-def generate_requests(start_t: int, out_list: List[dict], 
-                      req_rate: float, width: int, height: int) -> None:
-    """Generate stochastic requests (Poisson-like) and append to out_list."""
-    gen = RequestGenerator(rate=req_rate, width=width, height=height)
-    new_requests = gen.maybe_generate(start_t)
-    
-    for req in new_requests:
-        out_list.append(request_to_dict(req))
-
-
-def init_state(drivers_data: List[dict], requests_data: List[dict],
-               timeout: int, req_rate: float, width: int, height: int) -> dict:
-    """Build DeliverySimulation from procedural driver/request dicts."""
-    global _simulation
-    
+def build_simulation(drivers_data: List[dict], requests_data: List[dict],
+                     timeout: int, req_rate: float, width: int, height: int) -> DeliverySimulation:
+    """Build a standalone DeliverySimulation from procedural driver/request dicts (no module state)."""
     # Convert dicts to OOP objects using helpers
     drivers = [create_driver_from_dict(d, idx) for idx, d in enumerate(drivers_data)]
     requests = [create_request_from_dict(r) for r in requests_data]
@@ -62,7 +38,7 @@ def init_state(drivers_data: List[dict], requests_data: List[dict],
     generator = RequestGenerator(rate=effective_rate, width=width, height=height)
     
     # Create the main simulation object
-    _simulation = DeliverySimulation(
+    simulation = DeliverySimulation(
         drivers=drivers,
         dispatch_policy=policy,
         request_generator=generator,
@@ -70,48 +46,140 @@ def init_state(drivers_data: List[dict], requests_data: List[dict],
         timeout=timeout,
     )
     
-    # Store pre-loaded CSV requests for time-based injection
-    _simulation._all_csv_requests = requests
-    _simulation._csv_requests_index = 0 
-    
-    # Initialize time-series tracking for post-simulation reporting
-    global _time_series
-    _time_series = SimulationTimeSeries()
+    # Store pre-loaded CSV requests for time-based injection, ordered by arrival so
+    # each tick releases the ready ones by advancing an index instead of rescanning
+    requests.sort(key=lambda r: r.creation_time)
+    simulation._all_csv_requests = requests
+    simulation._csv_requests_index = 0 
     
-    # Return initial state dict using helper
-    return sim_to_state_dict(_simulation)
+    return simulation
 
 
-def simulate_step(state: dict) -> Tuple[dict, dict]:
-    """Advance one tick, record metrics, and return (state_dict, metrics)."""
-    global _simulation, _time_series
-    
-    # If _simulation is None, attempt to recover by checking if state has been initialized
-    if _simulation is None:
-        # Check if we have a valid state dict (should have 't', 'drivers', 'pending' keys)
-        if not state or "drivers" not in state:
+# ====================================================================
+# Adapter sessions
+# ====================================================================
+
+class SimulationAdapter:
+    """A self-contained adapter session with its own simulation, time series and request generators.
+    The module-level functions below drive the default GUI session; create one
+    SimulationAdapter per concurrent session (tests, notebooks, sweeps).
+    """
+
+    def __init__(self) -> None:
+        self.simulation: DeliverySimulation | None = None
+        self.time_series: SimulationTimeSeries | None = None
+        # One generator per (req_rate, width, height), kept so this session's request ids keep counting up
+        self._request_generators: Dict[Tuple[float, int, int], RequestGenerator] = {}
+
+    def generate_requests(self, start_t: int, out_list: List[dict],
+                          req_rate: float, width: int, height: int) -> None:
+        """Generate stochastic requests (Poisson-like) and append to out_list."""
+        key = (req_rate, width, height)
+        gen = self._request_generators.get(key)
+        if gen is None:
+            gen = self._request_generators[key] = RequestGenerator(rate=req_rate, width=width, height=height)
+        out_list.extend([request_to_dict(req) for req in gen.maybe_generate(start_t)])
+
+    def init_state(self, drivers_data: List[dict], requests_data: List[dict],
+                   timeout: int, req_rate: float, width: int, height: int) -> dict:
+        """Build DeliverySimulation from procedural driver/request dicts."""
+        self.simulation = build_simulation(drivers_data, requests_data, timeout, req_rate, width, height)
+        
+        # Initialize time-series tracking for post-simulation reporting
+        self.time_series = SimulationTimeSeries()
+        
+        # Return initial state dict using helper
+        return sim_to_state_dict(self.simulation)
+
+    def simulate_step(self, state: dict) -> Tuple[dict, dict]:
+        """Advance one tick, record metrics, and return (state_dict, metrics)."""
+        if self.simulation is None:
+            # Check if we have a valid state dict (should have 't', 'drivers', 'pending' keys)
+            if not state or "drivers" not in state:
+                raise RuntimeError(
+                    "Simulation not initialized. Call init_state() first. "
+                    "State dict is missing required keys: 't', 'drivers', 'pending'."
+                )
+            # State exists but simulation object was lost
             raise RuntimeError(
                 "Simulation not initialized. Call init_state() first. "
-                "State dict is missing required keys: 't', 'drivers', 'pending'."
+                "The simulation context was lost (possible module reload)."
             )
-        # State exists but simulation object was lost
-        raise RuntimeError(
-            "Simulation not initialized. Call init_state() first. "
-            "The simulation context was lost (possible module reload)."
-        )
-    
-    # Run one simulation tick
-    _simulation.tick()
-    
-    # Record metrics for post-simulation reporting
-    if _time_series is not None:
-        _time_series.record_tick(_simulation)
-    
-    # Convert OOP state back to dicts for GUI consumption
-    updated_state = sim_to_state_dict(_simulation)
-    metrics = get_adapter_metrics(_simulation)
-    
-    return updated_state, metrics
+        
+        # Run one simulation tick and record metrics
+        _, metrics = self._tick_and_metrics()
+        
+        # Convert OOP state back to dicts for GUI consumption
+        return sim_to_state_dict(self.simulation), metrics
+
+    def step_simulation(self) -> Tuple[int, dict]:
+        """Advance one tick and return (time, metrics)."""
+        self._require_simulation()
+        # Only time and metrics are surfaced, so skip building the GUI state dict
+        return self._tick_and_metrics()
+
+    def get_plot_data(self):
+        """Return plot-ready tuples (drivers, pickups, dropoffs, arrows)."""
+        self._require_simulation()
+        # Plotting needs only positions and statuses: skip building the full GUI state dict
+        return get_plot_data_from_simulation(self.simulation)
+
+    def backend(self) -> Dict[str, Callable]:
+        """Return the 6-function backend dict bound to this session."""
+        return {
+            "load_drivers": load_drivers,
+            "load_requests": load_requests,
+            "generate_drivers": generate_drivers,
+            "generate_requests": self.generate_requests,
+            "init_state": self.init_state,
+            "simulate_step": self.simulate_step,
+        }
+
+    def _require_simulation(self) -> None:
+        """Raise RuntimeError if init_state has not been called yet."""
+        if self.simulation is None:
+            raise RuntimeError("Simulation not initialized. Call init_state() first.")
+
+    def _tick_and_metrics(self) -> Tuple[int, dict]:
+        """Advance one tick, record metrics, and return (time, metrics) without building a state dict."""
+        simulation = self.simulation
+        simulation.tick()
+        
+        # Record metrics for post-simulation reporting
+        if self.time_series is not None:
+            self.time_series.record_tick(simulation)
+        
+        return int(simulation.time), get_adapter_metrics(simulation)
+
+
+# ====================================================================
+# Module-level simulation state
+# ====================================================================
+
+# Default GUI session behind the module-level functions; get_simulation() and
+# get_time_series() read its state for reporting after the GUI closes
+_gui_session = SimulationAdapter()
+
+
+# ====================================================================
+# Adapter functions (called by GUI)
+# ====================================================================
+
+def generate_requests(start_t: int, out_list: List[dict], 
+                      req_rate: float, width: int, height: int) -> None:
+    """Generate stochastic requests (Poisson-like) and append to out_list."""
+    _gui_session.generate_requests(start_t, out_list, req_rate, width, height)
+
+
+def init_state(drivers_data: List[dict], requests_data: List[dict],
+               timeout: int, req_rate: float, width: int, height: int) -> dict:
+    """Build DeliverySimulation from procedural driver/request dicts."""
+    return _gui_session.init_state(drivers_data, requests_data, timeout, req_rate, width, height)
+
+
+def simulate_step(state: dict) -> Tuple[dict, dict]:
+    """Advance one tick, record metrics, and return (state_dict, metrics)."""
+    return _gui_session.simulate_step(state)
 
 
 # ====================================================================
@@ -126,22 +194,12 @@ def init_simulation(drivers_data: List[dict], requests_data: List[dict],
 
 def step_simulation() -> Tuple[int, dict]:
     """Assignment wrapper: advance one tick and return (time, metrics)."""
-    if _simulation is None:
-        raise RuntimeError("Simulation not initialized. Call init_simulation() first.")
-
-    # Reuse existing simulate_step; we ignore the returned state here and surface time+metrics
-    state_dict = sim_to_state_dict(_simulation)
-    updated_state, metrics = simulate_step(state_dict)
-    return int(updated_state.get("t", 0)), metrics
+    return _gui_session.step_simulation()
 
 
 def get_plot_data():
     """Assignment wrapper: return plot-ready tuples (drivers, pickups, dropoffs, arrows)."""
-    if _simulation is None:
-        raise RuntimeError("Simulation not initialized. Call init_simulation() first.")
-
-    state = sim_to_state_dict(_simulation)
-    return get_plot_data_from_state(state)
+    return _gui_session.get_plot_data()
 
 
 # ====================================================================
@@ -150,12 +208,12 @@ def get_plot_data():
 
 def get_simulation() -> Optional[DeliverySimulation]:
     """Return the live DeliverySimulation or None if not initialized."""
-    return _simulation
+    return _gui_session.simulation
 
 
 def get_time_series() -> Optional[SimulationTimeSeries]:
     """Return the recorded SimulationTimeSeries (or None if not started)."""
-    return _time_series
+    return _gui_session.time_series
 
 
 # ====================================================================
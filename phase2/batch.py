@@ -0,0 +1,102 @@
+# ====================================================================
+# Batch replications: independent simulations run side by side
+# ====================================================================
+
+from __future__ import annotations
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from phase1.io_mod import generate_drivers
+from .adapter import build_simulation
+from .helpers_2.metrics_helpers import SimulationTimeSeries
+
+
+# Defaults match the GUI's starting controls and 50x30 grid
+DEFAULT_N_DRIVERS = 10
+DEFAULT_REQ_RATE = 3.0
+DEFAULT_HORIZON = 600
+DEFAULT_TIMEOUT = 10
+DEFAULT_WIDTH = 50
+DEFAULT_HEIGHT = 30
+
+
+def run_series(config: Dict[str, Any]) -> SimulationTimeSeries:
+    """Run one replication end to end on its own simulation and return its time series.
+
+    Recognised keys (all optional): drivers, n_drivers, requests, req_rate,
+    horizon, timeout, width, height, seed. A seeded run restores the caller's
+    random state afterwards.
+    """
+    seed = config.get("seed")
+    if seed is None:
+        return _simulate(config)
+
+    # In-process runs (run_one, n_workers=1) must not reset the caller's random stream
+    saved_state = random.getstate()
+    random.seed(seed)
+    try:
+        return _simulate(config)
+    finally:
+        random.setstate(saved_state)
+
+
+def _simulate(config: Dict[str, Any]) -> SimulationTimeSeries:
+    """Build and run the simulation described by config (see run_series)."""
+    width = config.get("width", DEFAULT_WIDTH)
+    height = config.get("height", DEFAULT_HEIGHT)
+    drivers = config.get("drivers")
+    if drivers is None:
+        drivers = generate_drivers(config.get("n_drivers", DEFAULT_N_DRIVERS), width, height)
+
+    # Local simulation and time series: nothing is shared with the adapter's GUI session
+    simulation = build_simulation(
+        drivers,
+        config.get("requests", []),
+        config.get("timeout", DEFAULT_TIMEOUT),
+        config.get("req_rate", DEFAULT_REQ_RATE),
+        width,
+        height,
+    )
+    time_series = SimulationTimeSeries()
+    for _ in range(config.get("horizon", DEFAULT_HORIZON)):
+        simulation.tick()
+        time_series.record_tick(simulation)
+
+    return time_series
+
+
+def run_one(config: Dict[str, Any]) -> dict:
+    """Run one replication (see run_series) and return its final summary."""
+    return run_series(config).get_final_summary()
+
+
+def _map_replications(fn: Callable[[Dict[str, Any]], Any], configs: List[Dict[str, Any]],
+                      n_workers: Optional[int]) -> list:
+    """Apply fn to every config, in config order, across worker processes."""
+    if n_workers is not None and n_workers < 1:
+        raise ValueError(f"n_workers must be positive, got {n_workers}")
+
+    if n_workers == 1 or len(configs) <= 1:
+        return [fn(config) for config in configs]
+
+    # A few chunks per worker: fewer round-trips for long sweeps, still balanced at the tail
+    workers = n_workers or os.cpu_count() or 1
+    chunksize = max(1, len(configs) // (workers * 4))
+
+    # Replications share no state, so each one runs in its own interpreter (no GIL contention)
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        return list(executor.map(fn, configs, chunksize=chunksize))
+
+
+def run_batch(configs: List[Dict[str, Any]], n_workers: Optional[int] = None) -> List[dict]:
+    """Run every config as an independent replication and return the final summaries.
+    Results come back in config order; n_workers=1 runs them in this process."""
+    return _map_replications(run_one, configs, n_workers)
+
+
+def run_replications(configs: List[Dict[str, Any]],
+                     n_workers: Optional[int] = None) -> List[SimulationTimeSeries]:
+    """Like run_batch, but return each replication's full SimulationTimeSeries."""
+    return _map_replications(run_series, configs, n_workers)
@@ -1,9 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    from .offer import Offer
-    from .driver import Driver
+from .offer import Offer
+from .driver import Driver
 
 
 # ====================================================================
@@ -11,11 +9,25 @@ if TYPE_CHECKING:
 
 # LazyBehaviour: Maximum acceptable distance to pickup location
 LAZY_MAX_PICKUP_DISTANCE = 5.0
+_LAZY_MAX_PICKUP_DISTANCE_SQ = LAZY_MAX_PICKUP_DISTANCE * LAZY_MAX_PICKUP_DISTANCE
+
+
+def _check_decide_args(driver: Driver, offer: Offer, time: int) -> None:
+    """Type-check decide() arguments (skipped entirely under python -O)."""
+    if not isinstance(driver, Driver):
+        raise TypeError(f"decide() requires Driver, got {type(driver).__name__}")
+    if not isinstance(offer, Offer):
+        raise TypeError(f"decide() requires Offer, got {type(offer).__name__}")
+    if not isinstance(time, int):
+        raise TypeError(f"decide() requires int time, got {type(time).__name__}")
 
 
 class DriverBehaviour(ABC):
     """Abstract base class for driver decision strategies."""
 
+    # Behaviours hold only their thresholds: slots keep them dict-free
+    __slots__ = ()
+
     @abstractmethod
     def decide(self, driver: "Driver", offer: "Offer", time: int) -> bool:
         """Decide whether driver accepts the offer."""
@@ -25,26 +37,33 @@ class DriverBehaviour(ABC):
 class GreedyDistanceBehaviour(DriverBehaviour):
     """Accept offers with pickup distance <= max_distance threshold."""
 
+    __slots__ = ("_max_distance", "_max_distance_sq")
+
     def __init__(self, max_distance: float):
         """Initialize greedy distance behaviour."""
         if max_distance <= 0:
             raise ValueError(f"max_distance must be positive, got {max_distance}")
         self.max_distance = max_distance
 
+    @property
+    def max_distance(self) -> float:
+        """Pickup distance threshold."""
+        return self._max_distance
+
+    @max_distance.setter
+    def max_distance(self, value: float) -> None:
+        # Squared threshold kept alongside so decide() compares without sqrt or multiply
+        self._max_distance = value
+        self._max_distance_sq = value * value
+
     def decide(self, driver: "Driver", offer: "Offer", time: int) -> bool:
         """Accept if pickup distance is within max_distance threshold."""
-        from .driver import Driver as DriverClass
-        from .offer import Offer as OfferClass
+        if __debug__:
+            _check_decide_args(driver, offer, time)
         
-        if not isinstance(driver, DriverClass):
-            raise TypeError(f"decide() requires Driver, got {type(driver).__name__}")
-        if not isinstance(offer, OfferClass):
-            raise TypeError(f"decide() requires Offer, got {type(offer).__name__}")
-        if not isinstance(time, int):
-            raise TypeError(f"decide() requires int time, got {type(time).__name__}")
-        
-        dist = driver.position.distance_to(offer.request.pickup)
-        return dist <= self.max_distance
+        # Compare squared distances: same answer as dist <= max_distance, without the sqrt
+        dist_sq = driver.position.distance_sq_to(offer.request.pickup)
+        return dist_sq <= self._max_distance_sq
 
 
 class EarningsMaxBehaviour(DriverBehaviour):
@@ -52,6 +71,8 @@ class EarningsMaxBehaviour(DriverBehaviour):
     Efficiency-focused drivers who maximize hourly earnings regardless of distance.
     """
 
+    __slots__ = ("threshold",)
+
     def __init__(self, min_reward_per_time: float):
         """Initialize earnings maximization behaviour."""
         if min_reward_per_time < 0:
@@ -60,15 +81,8 @@ class EarningsMaxBehaviour(DriverBehaviour):
 
     def decide(self, driver: "Driver", offer: "Offer", time: int) -> bool:
         """Accept if reward/travel_time >= threshold."""
-        from .driver import Driver as DriverClass
-        from .offer import Offer as OfferClass
-        
-        if not isinstance(driver, DriverClass):
-            raise TypeError(f"decide() requires Driver, got {type(driver).__name__}")
-        if not isinstance(offer, OfferClass):
-            raise TypeError(f"decide() requires Offer, got {type(offer).__name__}")
-        if not isinstance(time, int):
-            raise TypeError(f"decide() requires int time, got {type(time).__name__}")
+        if __debug__:
+            _check_decide_args(driver, offer, time)
         
         # Accept if reward per time unit meets threshold
         return offer.reward_per_time() >= self.threshold
@@ -79,6 +93,8 @@ class LazyBehaviour(DriverBehaviour):
     Selective drivers who need rest and prefer nearby jobs.
     """
 
+    __slots__ = ("idle_ticks_needed",)
+
     def __init__(self, idle_ticks_needed: int):
         """Initialize lazy behaviour."""
         if idle_ticks_needed < 0:
@@ -87,21 +103,15 @@ class LazyBehaviour(DriverBehaviour):
 
     def decide(self, driver: "Driver", offer: "Offer", time: int) -> bool:
         """Accept only if idle >= min_ticks AND pickup distance < 5.0."""
-        from .driver import Driver as DriverClass
-        from .offer import Offer as OfferClass
-        
-        if not isinstance(driver, DriverClass):
-            raise TypeError(f"decide() requires Driver, got {type(driver).__name__}")
-        if not isinstance(offer, OfferClass):
-            raise TypeError(f"decide() requires Offer, got {type(offer).__name__}")
-        if not isinstance(time, int):
-            raise TypeError(f"decide() requires int time, got {type(time).__name__}")
+        if __debug__:
+            _check_decide_args(driver, offer, time)
         
         # Calculate how long driver has been idle
         idle_duration = time - driver.idle_since
         
-        # Calculate distance to pickup location
-        distance_to_pickup = driver.position.distance_to(offer.request.pickup)
+        # Not rested enough: reject before measuring the pickup distance
+        if idle_duration < self.idle_ticks_needed:
+            return False
         
-        # Accept only if both conditions are met: sufficient rest AND nearby job
-        return idle_duration >= self.idle_ticks_needed and distance_to_pickup < LAZY_MAX_PICKUP_DISTANCE
+        # Rested: accept only a nearby job (squared distance against the squared limit, no sqrt)
+        return driver.position.distance_sq_to(offer.request.pickup) < _LAZY_MAX_PICKUP_DISTANCE_SQ
@@ -1,8 +1,9 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
+import math
 from typing import Optional, List, Dict, Any, TYPE_CHECKING
 from .point import Point
-from .helpers_2.core_helpers import is_at_target, move_towards, record_assignment_start, record_completion
+from .helpers_2.core_helpers import advance_towards, record_assignment_start, record_completion
 
 if TYPE_CHECKING:
     from phase2.behaviours import DriverBehaviour
@@ -13,9 +14,10 @@ IDLE = "IDLE"
 TO_PICKUP = "TO_PICKUP"
 TO_DROPOFF = "TO_DROPOFF"
 
-@dataclass
+@dataclass(slots=True)
 class Driver:
-    """Agent that transports requests from pickup to dropoff locations, earning rewards."""
+    """Agent that transports requests from pickup to dropoff locations, earning rewards.
+    Uses __slots__ (no per-instance __dict__) to keep many drivers compact."""
 
     # Attributes
     id: int
@@ -27,6 +29,8 @@ class Driver:
     history: List[Dict[str, Any]] = field(default_factory=list)
     idle_since: Optional[int] = 0
     earnings: float = 0.0
+    # Set by MutationRule; declared here because slotted instances reject new attributes
+    _last_mutation_time: float = field(default=-float("inf"), init=False, repr=False, compare=False)
 
     # Convenience helpers
     def is_idle(self) -> bool:
@@ -55,24 +59,23 @@ class Driver:
             return self.current_request.dropoff
         return None
 
-    def step(self, dt: float) -> None:
+    def step(self, dt: float) -> float:
         """
         Move the driver towards its current target by at most speed * dt.
         Uses epsilon-safe arrival detection and movement calculation.
         Prevents overshooting the target.
+        Returns the distance still left to the target (inf if there is no target).
         """
         # Check if driver has a target point
         target = self.target_point()
         if target is None:
-            return
-
-        # Check if already at target (epsilon-safe)
-        if is_at_target(self.position, target):
-            return
+            return math.inf
 
-        # Move towards target without overshooting
+        # Move towards target without overshooting (advance_towards leaves the
+        # position in place when already at target, so no separate check needed)
         distance = self.speed * dt
-        self.position = move_towards(self.position, target, distance)
+        self.position, remaining = advance_towards(self.position, target, distance)
+        return remaining
 
     def complete_pickup(self, time: int) -> None:
         """Mark pickup complete and transition to TO_DROPOFF state."""
@@ -1,14 +1,15 @@
 import random
 import math
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
 if TYPE_CHECKING:
     from phase2.request import Request
     from phase2.point import Point
 
 
-def _generate_poisson(rate: float) -> int:
-    """Generate a Poisson-distributed random number (Knuth's algorithm)."""
+def _generate_poisson(rate: float, threshold: Optional[float] = None) -> int:
+    """Generate a Poisson-distributed random number (Knuth's algorithm).
+    threshold is exp(-rate) if the caller already has it."""
     if rate < 0:
         raise ValueError(f"rate must be non-negative, got {rate}")
     
@@ -16,7 +17,7 @@ def _generate_poisson(rate: float) -> int:
         return 0
     
     # Knuth's algorithm
-    L = math.exp(-rate)
+    L = math.exp(-rate) if threshold is None else threshold
     k = 0
     p = 1.0
     
@@ -51,10 +52,22 @@ class RequestGenerator:
         self.next_id = start_id    
         self.enabled = enabled     
 
+    @property
+    def rate(self) -> float:
+        """Mean number of requests per tick."""
+        return self._rate
+
+    @rate.setter
+    def rate(self, value: float) -> None:
+        # exp(-rate) computed once per rate, not on every tick's Poisson draw
+        self._rate = value
+        self._poisson_threshold = math.exp(-value)
+
     def maybe_generate(self, time: int) -> List["Request"]:
         """Generate requests at the given simulation time."""
-        # If disabled, return empty list (used when CSV requests are loaded)
-        if not self.enabled:
+        # If disabled or at rate 0 (CSV requests loaded), nothing can be generated:
+        # return before the imports and the Poisson draw
+        if not self.enabled or self.rate == 0:
             return []
         
         # Import here to avoid circular imports at module level
@@ -62,7 +75,7 @@ class RequestGenerator:
         from phase2.point import Point
         
         # Generate number of requests from Poisson distribution
-        num_requests = _generate_poisson(self.rate)
+        num_requests = _generate_poisson(self.rate, self._poisson_threshold)
 
         new_requests: List[Request] = []
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Tuple
+import math
 
 if TYPE_CHECKING:
     from phase2.point import Point
@@ -7,33 +8,34 @@ if TYPE_CHECKING:
 # Constants
 EPSILON = 1e-9
 
+# Bound once so the per-tick movement code skips the math attribute lookup
+_hypot = math.hypot
 
-def is_at_target(current: "Point", target: "Point", tolerance: float = EPSILON) -> bool:
-    """Return True if current is at target within tolerance."""
-    return current.distance_to(target) <= tolerance
 
-
-def move_towards(current: "Point", target: "Point", distance: float) -> "Point":
-    """Move current towards target by distance."""
+def advance_towards(current: "Point", target: "Point", distance: float) -> Tuple["Point", float]:
+    """Move current towards target by distance; return (new point, distance left to target)."""
     from phase2.point import Point  # Import here to avoid circular import
     
     if distance < 0:
         raise ValueError(f"Distance must be non-negative, got {distance}")
     
-    total_dist = current.distance_to(target)
+    # Offset to target, computed once and reused for both length and direction
+    dx = target.x - current.x
+    dy = target.y - current.y
+    total_dist = _hypot(dx, dy)
     
     # Already at target
     if total_dist < EPSILON:
-        return Point(current.x, current.y)
-    
-    # Fraction of distance to move (clamped to 1.0 to prevent overshoot)
-    frac = min(1.0, distance / total_dist)
+        return Point(current.x, current.y), total_dist
     
-    # Linear interpolation
-    dx = (target.x - current.x) * frac
-    dy = (target.y - current.y) * frac
+    # Step reaches the target: land on it exactly (no overshoot, no rounding drift)
+    if distance >= total_dist:
+        return Point(target.x, target.y), 0.0
     
-    return Point(current.x + dx, current.y + dy)
+    # Linear interpolation by the fraction of the remaining distance covered;
+    # the length left falls out of the same offset, so callers need no second hypot
+    frac = distance / total_dist
+    return Point(current.x + dx * frac, current.y + dy * frac), total_dist - distance
 
 
 def record_assignment_start(history: list, request_id: int, current_time: int) -> None:
@@ -1,8 +1,9 @@
-from ..request import Request, WAITING, ASSIGNED, PICKED, EXPIRED
+from ..request import Request, WAITING, ASSIGNED, PICKED, DELIVERED, EXPIRED
 from ..offer import Offer
 from ..point import Point
 from ..driver import Driver
 from ..behaviours import LazyBehaviour, GreedyDistanceBehaviour, EarningsMaxBehaviour
+import math
 import random
 
 
@@ -10,16 +11,19 @@ import random
 # DICT <-> OBJECT CONVERSION HELPERS (for adapter)
 # ====================================================================
 
+# (behaviour class, threshold) pairs; each driver gets its own instance so
+# adjusting one driver's threshold never changes another driver's
+_INITIAL_BEHAVIOURS = (
+    (GreedyDistanceBehaviour, 10.0),
+    (EarningsMaxBehaviour, 1.0),
+    (LazyBehaviour, 5),
+)
+
+
 def _assign_random_behaviour() -> "DriverBehaviour":
     """Randomly assign one of three driver behaviours."""
-    choice = random.choice(["greedy", "earnings", "lazy"])
-    
-    if choice == "greedy":
-        return GreedyDistanceBehaviour(max_distance=10.0)
-    elif choice == "earnings":
-        return EarningsMaxBehaviour(min_reward_per_time=1.0)
-    else:  # choice == "lazy"
-        return LazyBehaviour(idle_ticks_needed=5)
+    behaviour_cls, threshold = random.choice(_INITIAL_BEHAVIOURS)
+    return behaviour_cls(threshold)
 
 
 def create_driver_from_dict(d_dict: dict, idx: int = 0) -> "Driver":
@@ -55,21 +59,22 @@ def request_to_dict(req: "Request") -> dict:
     }
 
 
-def get_plot_data_from_state(state: dict):
-    """Extract plot-ready tuples from state dict."""
-    drivers = state.get("drivers", [])
-    pending = state.get("pending", [])
+# Plot bucket per request status: 0 = draw pickup, 1 = draw dropoff (others are not drawn)
+_PLOT_BUCKET = {WAITING: 0, ASSIGNED: 0, PICKED: 1}
 
-    drivers_xy = [(float(d.get("x", 0.0)), float(d.get("y", 0.0))) for d in drivers]
+
+def get_plot_data_from_simulation(simulation):
+    """Extract plot-ready tuples (drivers, pickups, dropoffs, arrows) straight off the simulation objects."""
+    drivers_xy = [(float(d.position.x), float(d.position.y)) for d in simulation.drivers]
     pickup_xy = []
     dropoff_xy = []
 
-    for r in pending:
-        status = r.get("status", "").upper()
-        if status in ("WAITING", "ASSIGNED"):
-            pickup_xy.append((float(r["px"]), float(r["py"])))
-        elif status == "PICKED":
-            dropoff_xy.append((float(r["dx"]), float(r["dy"])))
+    for r in simulation.requests:
+        bucket = _PLOT_BUCKET.get(r.status)
+        if bucket == 0:
+            pickup_xy.append((float(r.pickup.x), float(r.pickup.y)))
+        elif bucket == 1:
+            dropoff_xy.append((float(r.dropoff.x), float(r.dropoff.y)))
 
     dir_quiver = []
     return drivers_xy, pickup_xy, dropoff_xy, dir_quiver
@@ -82,11 +87,14 @@ def get_plot_data_from_state(state: dict):
 def gen_requests(simulation):
     """Generate new requests via request_generator.maybe_generate, and inject pre-loaded CSV requests."""
     # First, check if there are pre-loaded CSV requests waiting to arrive
-    if hasattr(simulation, '_all_csv_requests') and hasattr(simulation, '_csv_requests_index'):
-        csv_idx = simulation._csv_requests_index
-        while csv_idx < len(simulation._all_csv_requests):
-            req = simulation._all_csv_requests[csv_idx]
-            if req.creation_time <= simulation.time:
+    csv_requests = getattr(simulation, '_all_csv_requests', None)
+    csv_idx = getattr(simulation, '_csv_requests_index', None)
+    # Once every CSV request has been released this is a single comparison per tick
+    if csv_requests is not None and csv_idx is not None and csv_idx < len(csv_requests):
+        now = simulation.time
+        while csv_idx < len(csv_requests):
+            req = csv_requests[csv_idx]
+            if req.creation_time <= now:
                 # Request has arrived, add it
                 simulation.requests.append(req)
                 csv_idx += 1
@@ -101,11 +109,23 @@ def gen_requests(simulation):
 
 
 def expire_requests(simulation):
-    """Mark WAITING requests as EXPIRED if age > timeout. Increment expired_count."""
+    """Mark WAITING requests as EXPIRED if age > timeout. Increment expired_count.
+    Finished (delivered or expired) requests are dropped from simulation.requests in the same pass."""
+    # age > timeout  <=>  creation_time < time - timeout: one subtraction per tick, not per request
+    now = simulation.time
+    cutoff = now - simulation.timeout
+    live = []
+    expired = 0
     for r in simulation.requests:
-        if r.status == WAITING and (simulation.time - r.creation_time) > simulation.timeout:
-            r.mark_expired(simulation.time)
-            simulation.expired_count += 1
+        status = r.status
+        if status == WAITING and r.creation_time < cutoff:
+            r.mark_expired(now)
+            expired += 1
+        elif status != DELIVERED and status != EXPIRED:
+            live.append(r)
+    simulation.expired_count += expired
+    # Every later phase walks this list, so keep it to in-flight requests only
+    simulation.requests[:] = live
 
 
 def get_proposals(simulation):
@@ -118,16 +138,22 @@ def collect_offers(simulation, proposals):
     if not isinstance(proposals, list):
         raise TypeError(f"proposals must be list, got {type(proposals).__name__}")
     
-    from collections import defaultdict
     EPSILON = 1e-3
     MIN_SPEED = 1e-6
+    hypot = math.hypot
     
     offers = []
     for d, r in proposals:
         if r.status != WAITING:
             continue
-        travel_time = d.position.distance_to(r.pickup) / max(d.speed, MIN_SPEED)
-        reward = r.pickup.distance_to(r.dropoff)
+        # Plain float offsets: no Point method call (and type check) per distance
+        pos = d.position
+        pickup = r.pickup
+        dropoff = r.dropoff
+        px = pickup.x
+        py = pickup.y
+        travel_time = hypot(px - pos.x, py - pos.y) / max(d.speed, MIN_SPEED)
+        reward = hypot(dropoff.x - px, dropoff.y - py)
         off = Offer(d, r, travel_time, reward)
         if d.behaviour and d.behaviour.decide(d, off, simulation.time):
             offers.append(off)
@@ -145,7 +171,7 @@ def resolve_conflicts(simulation, offers):
         grouped[o.request.id].append(o)
     final = []
     for same_req in grouped.values():
-        same_req.sort(key=lambda o: o.driver.position.distance_to(o.request.pickup))
+        same_req.sort(key=lambda o: o.driver.position.distance_sq_to(o.request.pickup))
         final.append(same_req[0])
     return final
 
@@ -164,9 +190,8 @@ def move_drivers(simulation):
     for d in simulation.drivers:
         if d.status not in ("TO_PICKUP", "TO_DROPOFF"):
             continue
-        d.step(1.0)
-        tgt = d.target_point()
-        if not tgt or d.position.distance_to(tgt) >= EPSILON:
+        # step() reports the distance left, so arrival needs no second target lookup or distance
+        if d.step(1.0) >= EPSILON:
             continue
         if d.status == "TO_PICKUP":
             handle_pickup(simulation, d)
@@ -185,11 +210,10 @@ def handle_dropoff(simulation, driver):
     last = driver.history[-1]
     beh = type(driver.behaviour).__name__ if driver.behaviour else "None"
     simulation.earnings_by_behaviour[beh].append(last.get("fare", 0.0))
-    wait = last["time"] - last.get("start_time", last["time"])
-    simulation._wait_samples.append(wait)
-    n = len(simulation._wait_samples)
-    simulation.avg_wait += (wait - simulation.avg_wait) / n
+    # complete_dropoff already stored this trip's wait (time - creation_time); reuse it
+    wait = last["wait"]
     simulation.served_count += 1
+    simulation.avg_wait += (wait - simulation.avg_wait) / simulation.served_count
 
 
 def mutate_drivers(simulation):
@@ -208,13 +232,18 @@ def mutate_drivers(simulation):
 # ADAPTER HELPER FUNCTIONS (for state conversion)
 # ====================================================================
 
+# GUI spelling of each request status, looked up instead of lower()-ing a new string per request
+_STATE_STATUS = {s: s.lower() for s in (WAITING, ASSIGNED, PICKED, DELIVERED, EXPIRED)}
+
+
 def sim_to_state_dict(simulation):
     """Convert simulation to GUI state dict."""
-    snap = simulation.get_snapshot()
-    
+    # Only the driver rows are needed; the full snapshot's pickup/dropoff lists would be discarded.
+    # Finished requests are left out of "pending": the GUI looks requests up by id and searches
+    # for the nearest one by scanning this list, so it should not grow with every request ever made
     return {
-        "t": snap["time"],
-        "drivers": snap["drivers"],
+        "t": simulation.time,
+        "drivers": simulation.driver_snapshots(),
         "pending": [
             {
                 "id": r.id,
@@ -222,10 +251,11 @@ def sim_to_state_dict(simulation):
                 "py": r.pickup.y,
                 "dx": r.dropoff.x,
                 "dy": r.dropoff.y,
-                "status": r.status.lower(),
+                "status": _STATE_STATUS[r.status],
                 "t": r.creation_time,
             }
             for r in simulation.requests
+            if r.status != DELIVERED and r.status != EXPIRED
         ],
         "served": simulation.served_count,
         "expired": simulation.expired_count,
@@ -195,7 +195,7 @@ Behaviour Analysis:
   • Avg Stagnant:       {summary.get('avg_stagnant_drivers', 0):.1f}
 
 Total Drivers:         {len(simulation.drivers)}
-Total Requests:        {len(simulation.requests)}
+Open Requests:         {sum(1 for r in simulation.requests if r.is_active())}
 """
     return stats_text
 
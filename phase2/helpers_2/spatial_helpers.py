@@ -0,0 +1,153 @@
+from __future__ import annotations
+from typing import Dict, List, Set, Tuple
+import math
+
+
+# ====================================================================
+# UNIFORM BUCKET GRID (nearest-neighbour queries for policies)
+# ====================================================================
+
+def suggest_cell_size(xs: List[float], ys: List[float]) -> float:
+    """Return a cell edge giving roughly one point per cell over the points' bounding box."""
+    if not xs:
+        return 1.0
+    width = max(max(xs) - min(xs), 1.0)
+    height = max(max(ys) - min(ys), 1.0)
+    return math.sqrt(width * height / len(xs))
+
+
+class SpatialGrid:
+    """Uniform bucket grid over indexed 2D points.
+    Points are bucketed by (x // cell, y // cell); nearest() searches rings of
+    cells outwards from the query cell and stops once no farther ring can win.
+    """
+
+    def __init__(self, cell_size: float):
+        """Initialize an empty grid with square cells of the given edge length."""
+        if cell_size <= 0:
+            raise ValueError(f"cell_size must be positive, got {cell_size}")
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], Set[int]] = {}
+        self._points: Dict[int, Tuple[float, float]] = {}
+        # Extent of occupied cells, bounds how far a ring search has to go
+        self._min_cx = self._min_cy = math.inf
+        self._max_cx = self._max_cy = -math.inf
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, idx: int) -> bool:
+        return idx in self._points
+
+    def _cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        """Return the (column, row) cell containing (x, y)."""
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def insert(self, idx: int, x: float, y: float) -> None:
+        """Add point idx at (x, y)."""
+        cell = self._cell_of(x, y)
+        self._cells.setdefault(cell, set()).add(idx)
+        self._points[idx] = (x, y)
+        cx, cy = cell
+        self._min_cx = min(self._min_cx, cx)
+        self._max_cx = max(self._max_cx, cx)
+        self._min_cy = min(self._min_cy, cy)
+        self._max_cy = max(self._max_cy, cy)
+
+    def remove(self, idx: int) -> None:
+        """Remove point idx (no-op if absent)."""
+        point = self._points.pop(idx, None)
+        if point is None:
+            return
+        cell = self._cell_of(*point)
+        bucket = self._cells[cell]
+        bucket.discard(idx)
+        if not bucket:
+            del self._cells[cell]
+
+    def nearest(self, x: float, y: float) -> Tuple[int, float]:
+        """Return (idx, squared distance) of the point closest to (x, y), or (-1, inf) if empty.
+        Ties are broken by the lowest idx."""
+        best_idx = -1
+        best_sq = math.inf
+        if not self._points:
+            return best_idx, best_sq
+
+        cx, cy = self._cell_of(x, y)
+        max_ring = max(
+            abs(cx - self._min_cx), abs(cx - self._max_cx),
+            abs(cy - self._min_cy), abs(cy - self._max_cy),
+        )
+
+        ring = 0
+        while ring <= max_ring:
+            for cell in self._ring_cells(cx, cy, ring):
+                bucket = self._cells.get(cell)
+                if not bucket:
+                    continue
+                for idx in bucket:
+                    px, py = self._points[idx]
+                    ex = px - x
+                    ey = py - y
+                    dist_sq = ex * ex + ey * ey
+                    if dist_sq < best_sq or (dist_sq == best_sq and idx < best_idx):
+                        best_sq = dist_sq
+                        best_idx = idx
+
+            # Every point in ring k+1 or beyond is at least k * cell_size away
+            reach = ring * self.cell_size
+            if best_sq < reach * reach:
+                break
+            ring += 1
+
+        return best_idx, best_sq
+
+    @staticmethod
+    def _ring_cells(cx: int, cy: int, ring: int):
+        """Yield the cells at Chebyshev distance ring from (cx, cy)."""
+        if ring == 0:
+            yield (cx, cy)
+            return
+        for dx in range(-ring, ring + 1):
+            yield (cx + dx, cy - ring)
+            yield (cx + dx, cy + ring)
+        for dy in range(-ring + 1, ring):
+            yield (cx - ring, cy + dy)
+            yield (cx + ring, cy + dy)
+
+
+class LinearScan:
+    """Same interface as SpatialGrid but nearest() scans every point.
+    Cheaper than bucketing when only a handful of points are indexed."""
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._points: Dict[int, Tuple[float, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, idx: int) -> bool:
+        return idx in self._points
+
+    def insert(self, idx: int, x: float, y: float) -> None:
+        """Add point idx at (x, y)."""
+        self._points[idx] = (x, y)
+
+    def remove(self, idx: int) -> None:
+        """Remove point idx (no-op if absent)."""
+        self._points.pop(idx, None)
+
+    def nearest(self, x: float, y: float) -> Tuple[int, float]:
+        """Return (idx, squared distance) of the point closest to (x, y), or (-1, inf) if empty.
+        Ties are broken by the lowest idx."""
+        best_idx = -1
+        best_sq = math.inf
+        for idx, (px, py) in self._points.items():
+            ex = px - x
+            ey = py - y
+            dist_sq = ex * ex + ey * ey
+            if dist_sq < best_sq or (dist_sq == best_sq and idx < best_idx):
+                best_sq = dist_sq
+                best_idx = idx
+        return best_idx, best_sq
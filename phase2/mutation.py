@@ -167,8 +167,8 @@ class HybridMutation(MutationRule):
 
     def _can_mutate(self, driver: Driver, time: int) -> bool:
         """Check if driver is in cooldown period (can only mutate once per N ticks)."""
-        last_mutation_time = getattr(driver, "_last_mutation_time", -float("inf"))
-        return (time - last_mutation_time) >= self.cooldown_ticks
+        # Declared on Driver (defaults to -inf), so a plain slot read suffices
+        return (time - driver._last_mutation_time) >= self.cooldown_ticks
 
     def _record_mutation(self, driver: Driver, time: int) -> None:
         """Record that a mutation occurred at this time."""
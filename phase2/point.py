@@ -5,8 +5,11 @@ import math  # Provides mathematical functions such as hypot()
 # Epsilon for floating-point comparisons
 EPSILON = 1e-9
 
+# Bound once so distance_to() does one global lookup instead of math + attribute
+_hypot = math.hypot
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Point:
     """A 2D point representing a position on the map with vector operations.
     Immutable and hashable. Supports distance_to(), +, -, *, and in-place operators.
@@ -27,7 +30,18 @@ class Point:
         dy = self.y - other.y
 
         # math.hypot(dx, dy) = sqrt(dx*dx + dy*dy) Pythagorean theorem
-        return math.hypot(dx, dy)
+        return _hypot(dx, dy)
+
+
+    def distance_sq_to(self, other: "Point") -> float:
+        """Return squared Euclidean distance to another point.
+        Cheaper than distance_to() when distances are only compared (no sqrt)."""
+        if not isinstance(other, Point):
+            raise TypeError(f"distance_sq_to() requires a Point, got {type(other).__name__}")
+
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
 
 
     def __add__(self, other: "Point") -> "Point":
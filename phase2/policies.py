@@ -1,7 +1,9 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, List, Tuple
+import heapq
 from .driver import IDLE
 from .request import WAITING
+from .helpers_2.spatial_helpers import SpatialGrid, LinearScan, suggest_cell_size
 
 if TYPE_CHECKING:
     from phase2.driver import Driver
@@ -25,14 +27,84 @@ class DispatchPolicy:
         raise NotImplementedError
 
 
-
 # ====================================================================
 # Nearest Neighbour Policy
 # ====================================================================
 
+# Below this many idle drivers a plain scan beats building the bucket grid.
+# Measured with _match_closest_pairs on random 50x30 maps (5 seeds): the grid
+# loses at every size up to 120 drivers and only pulls ahead from ~150 when
+# requests are fewer than drivers (with requests == drivers the scan still
+# wins at 200, since the emptying grid has to search ever wider rings)
+GRID_MIN_DRIVERS = 150
+
+# Below this many idle drivers GlobalGreedyPolicy sorts the full n*m pair list
+# instead of calling _match_closest_pairs. Measured on random 50x30 maps
+# (3 seeds, matcher in plain-scan mode): flat 10x30 0.031s vs 0.033s per 300
+# calls, 12x12 0.019s vs 0.010s, 20x20 0.066s vs 0.022s, 100x100 0.66s vs 0.14s
+# per 30 calls, so the 10-driver GUI default keeps the flat path
+GLOBAL_GREEDY_MIN_DRIVERS = 12
+
+
+def _match_closest_pairs(
+        idle: List["Driver"],
+        waiting: List["Request"]
+    ) -> List[Tuple["Driver", "Request"]]:
+    """Repeatedly take the closest remaining (driver, request) pair.
+    Ties go to the lower driver index, then the lower request index."""
+    pairs: List[Tuple["Driver", "Request"]] = []
+
+    # Nothing to match: skip building the grid and heap
+    if not idle or not waiting:
+        return pairs
+
+    # Copy coordinates into flat per-axis lists (structure of arrays) so the
+    # inner scan works on plain floats instead of Point method calls
+    driver_xs = [d.position.x for d in idle]
+    driver_ys = [d.position.y for d in idle]
+    pickup_xs = [r.pickup.x for r in waiting]
+    pickup_ys = [r.pickup.y for r in waiting]
+
+    # Bucket idle drivers in a uniform grid so nearest queries only visit nearby cells;
+    # for a handful of drivers the grid setup costs more than scanning them all
+    if len(idle) < GRID_MIN_DRIVERS:
+        grid = LinearScan()
+    else:
+        grid = SpatialGrid(suggest_cell_size(driver_xs, driver_ys))
+    for i, (x, y) in enumerate(zip(driver_xs, driver_ys)):
+        grid.insert(i, x, y)
+
+    # Heap of (squared distance, driver index, request index): each request's
+    # nearest driver, so the top is the globally closest remaining pair
+    heap: List[Tuple[float, int, int]] = []
+    for j, (px, py) in enumerate(zip(pickup_xs, pickup_ys)):
+        i, dist_sq = grid.nearest(px, py)
+        if i >= 0:
+            heap.append((dist_sq, i, j))
+    heapq.heapify(heap)
+
+    # Greedy iterative nearest matching
+    while heap:
+        _, i, j = heapq.heappop(heap)
+
+        # Driver was taken by a closer pair: look up this request's next nearest
+        if i not in grid:
+            i, dist_sq = grid.nearest(pickup_xs[j], pickup_ys[j])
+            if i >= 0:
+                heapq.heappush(heap, (dist_sq, i, j))
+            continue
+
+        # Add best pair to result and remove from further consideration
+        pairs.append((idle[i], waiting[j]))
+        grid.remove(i)
+
+    return pairs
+
+
 class NearestNeighborPolicy(DispatchPolicy):
     """Iteratively finds closest idle driver-request pair, assigns it, and repeats.
-    Simple O(n²m²) but fast for small fleets."""
+    Idle drivers are bucketed in a SpatialGrid so each lookup only visits nearby cells
+    (small fleets use a LinearScan instead)."""
 
     def assign(
             self,
@@ -44,33 +116,7 @@ class NearestNeighborPolicy(DispatchPolicy):
         # Filter only idle drivers and waiting requests
         idle = [d for d in drivers if d.status == IDLE]
         waiting = [r for r in requests if r.status == WAITING]
-
-        pairs: List[Tuple["Driver", "Request"]] = []
-
-        # Greedy iterative nearest matching
-        while idle and waiting:
-            best_dist = float("inf")  # Initialize best distance as infinity
-            best_pair = None           # Initialize best pair as None
-
-            # Find the closest driver-request pair
-            for d in idle:
-                for r in waiting:
-                    # Compute Euclidean distance
-                    dist = d.position.distance_to(r.pickup)
-                    if dist < best_dist:
-                        best_dist = dist
-                        best_pair = (d, r)
-            
-            if best_pair is None:
-                break  # No valid pair found, exit loop
-            
-            # Add best pair to result and remove from further consideration
-            d_sel, r_sel = best_pair
-            pairs.append((d_sel, r_sel))
-            idle.remove(d_sel)
-            waiting.remove(r_sel)
-
-        return pairs
+        return _match_closest_pairs(idle, waiting)
 
 
 
@@ -80,8 +126,10 @@ class NearestNeighborPolicy(DispatchPolicy):
 
 class GlobalGreedyPolicy(DispatchPolicy):
     """Global greedy dispatch policy with distance-based optimization.
-    Computes all driver-request distances, sorts by distance, then greedily
-    selects shortest pairs. O(nm log(nm)), better quality than nearest-neighbor.
+    Selects driver-request pairs shortest first, as if every pair were sorted by
+    distance. Taking shortest pairs in order is the same as repeatedly taking the
+    closest remaining pair, so larger fleets use the shared closest-pair matching
+    instead of building all n*m pairs.
     """
 
     def assign(
@@ -95,28 +143,51 @@ class GlobalGreedyPolicy(DispatchPolicy):
         idle = [d for d in drivers if d.status == IDLE]
         waiting = [r for r in requests if r.status == WAITING]
 
-        # List to hold all possible (distance, driver, request) tuples
-        all_pairs: List[Tuple[float, "Driver", "Request"]] = []
-        for d in idle:
-            for r in waiting:
-                # Compute Euclidean distance from driver to pickup
-                dist = d.position.distance_to(r.pickup)
-                all_pairs.append((dist, d, r))
-
-        # Sort pairs by distance (ascending order - closest first)
-        all_pairs.sort(key=lambda x: x[0])
-
-        # Keep track of already assigned drivers and requests (by ID)
-        assigned_drivers = set()
-        assigned_requests = set()
+        # Nothing to match: skip building and sorting the pair list
+        if not idle or not waiting:
+            return []
+
+        # Enough drivers for the matcher to pay off: same pairs, without the n*m list
+        if len(idle) >= GLOBAL_GREEDY_MIN_DRIVERS:
+            return _match_closest_pairs(idle, waiting)
+
+        # Flat per-axis coordinate lists (structure of arrays), read once per tick
+        # instead of two attribute hops and a method call for every pair
+        pickup_xs = [r.pickup.x for r in waiting]
+        pickup_ys = [r.pickup.y for r in waiting]
+
+        # List to hold all possible (squared distance, driver index, request index) tuples
+        all_pairs: List[Tuple[float, int, int]] = []
+        for i, d in enumerate(idle):
+            dx = d.position.x
+            dy = d.position.y
+            for j, (px, py) in enumerate(zip(pickup_xs, pickup_ys)):
+                # Squared distance sorts the same as Euclidean distance, without the sqrt
+                ex = px - dx
+                ey = py - dy
+                all_pairs.append((ex * ex + ey * ey, i, j))
+
+        # Heapify in O(n*m) and pop closest first; ties fall back to driver then request
+        # order, same as a stable sort on distance. Only the popped pairs pay log(n*m),
+        # and the loop stops once every driver or request is matched
+        heapq.heapify(all_pairs)
+        heappop = heapq.heappop
+
+        # Keep track of already assigned drivers and requests (by index)
+        assigned_drivers = [False] * len(idle)
+        assigned_requests = [False] * len(waiting)
         result: List[Tuple["Driver", "Request"]] = []
 
         # Greedily pick the shortest pairs, avoiding reuse of driver/request
-        for dist, d, r in all_pairs:
-            if d.id in assigned_drivers or r.id in assigned_requests:
+        while all_pairs:
+            _, i, j = heappop(all_pairs)
+            if assigned_drivers[i] or assigned_requests[j]:
                 continue  # Skip if driver or request already assigned
-            result.append((d, r))
-            assigned_drivers.add(d.id)
-            assigned_requests.add(r.id)
+            result.append((idle[i], waiting[j]))
+            assigned_drivers[i] = True
+            assigned_requests[j] = True
+            # Every driver or every request is matched: nothing further can be added
+            if len(result) == len(idle) or len(result) == len(waiting):
+                break
 
         return result
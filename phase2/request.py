@@ -13,7 +13,7 @@ EXPIRED = "EXPIRED"      # Expired (not picked up in time)
 
 
 
-@dataclass
+@dataclass(slots=True)
 class Request:
     """Delivery request and its lifecycle state.
 
@@ -31,9 +31,10 @@ class DeliverySimulation:
 
         self.served_count = 0
         self.expired_count = 0
-        self._wait_samples = []
         self.avg_wait = 0.0
         self.earnings_by_behaviour = defaultdict(list)
+        # driver id -> (position, status, request, request status, row) from the last snapshot
+        self._driver_rows = {}
 
 
     # ================================================================
@@ -64,26 +65,59 @@ class DeliverySimulation:
     # ================================================================
     # Statistics and Snapshots
 
+    def driver_snapshots(self):
+        """Return one JSON-serializable row per driver (id, position, status, request, target).
+        Rows of drivers that have not moved or changed job since the last call are reused.
+        """
+        cache = self._driver_rows
+        rows = []
+        for d in self.drivers:
+            pos = d.position
+            status = d.status
+            req = d.current_request
+            req_status = None if req is None else req.status
+            # Points are immutable, so an unmoved driver still holds the same Point object
+            cached = cache.get(d.id)
+            if (cached is not None and cached[0] is pos and cached[1] == status
+                    and cached[2] is req and cached[3] == req_status):
+                rows.append(cached[4])
+                continue
+            if req is None:
+                rid = tx = ty = None
+            else:
+                # Target resolved once per driver: pickup until picked up, then dropoff
+                target = req.pickup if req_status in ("WAITING", "ASSIGNED") else req.dropoff
+                rid, tx, ty = req.id, target.x, target.y
+            row = {
+                "id": d.id,
+                "x": pos.x,
+                "y": pos.y,
+                "status": status,
+                "rid": rid,  # current request assignment
+                "tx": tx,
+                "ty": ty,
+            }
+            cache[d.id] = (pos, status, req, req_status, row)
+            rows.append(row)
+        return rows
+
     def get_snapshot(self):
         """Return a JSON-serializable snapshot."""
+        # Split requests into pickups and dropoffs in a single pass
+        pickups = []
+        dropoffs = []
+        for r in self.requests:
+            status = r.status
+            if status in ("WAITING", "ASSIGNED"):
+                pickups.append({"id": r.id, "x": r.pickup.x, "y": r.pickup.y})
+            elif status == "PICKED":
+                dropoffs.append({"id": r.id, "x": r.dropoff.x, "y": r.dropoff.y})
+
         return {
             "time": self.time,
-            "drivers": [
-                {
-                    "id": d.id,
-                    "x": d.position.x,
-                    "y": d.position.y,
-                    "status": d.status,
-                    "rid": d.current_request.id if d.current_request else None,  # current request assignment
-                    "tx": d.current_request.pickup.x if (d.current_request and d.current_request.status in ("WAITING", "ASSIGNED")) else (d.current_request.dropoff.x if d.current_request else None),
-                    "ty": d.current_request.pickup.y if (d.current_request and d.current_request.status in ("WAITING", "ASSIGNED")) else (d.current_request.dropoff.y if d.current_request else None),
-                }
-                for d in self.drivers
-            ],
-            "pickups": [{"id": r.id, "x": r.pickup.x, "y": r.pickup.y} for r in self.requests
-                        if r.status in ("WAITING", "ASSIGNED")],
-            "dropoffs": [{"id": r.id, "x": r.dropoff.x, "y": r.dropoff.y} for r in self.requests
-                         if r.status == "PICKED"],
+            "drivers": self.driver_snapshots(),
+            "pickups": pickups,
+            "dropoffs": dropoffs,
             "statistics": {
                 "served": self.served_count,
                 "expired": self.expired_count,
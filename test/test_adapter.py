@@ -8,11 +8,15 @@ from phase2.adapter import (
     get_simulation,
     get_time_series,
     create_phase2_backend,
+    init_simulation,
+    step_simulation,
+    SimulationAdapter,
 )
 from phase2.point import Point
-from phase2.request import Request, WAITING
+from phase2.request import Request, WAITING, ASSIGNED, PICKED, DELIVERED
 from phase2.driver import Driver, IDLE
 from phase2.simulation import DeliverySimulation
+from phase2.helpers_2.engine_helpers import sim_to_state_dict, get_plot_data_from_simulation
 
 
 class TestGenerateRequests(unittest.TestCase):
@@ -56,6 +60,15 @@ class TestGenerateRequests(unittest.TestCase):
             generate_requests(start_t=0, out_list=out_list, req_rate=-1.0,
                              width=50, height=50)
 
+    def test_generate_requests_ids_continue_across_calls(self):
+        """Repeated calls reuse one generator, so request ids never repeat."""
+        out_list = []
+        for t in range(5):
+            generate_requests(start_t=t, out_list=out_list, req_rate=5.0,
+                             width=40, height=30)
+        ids = [r['id'] for r in out_list]
+        self.assertEqual(len(ids), len(set(ids)))
+
 
 class TestInitState(unittest.TestCase):
     """Test state initialization."""
@@ -106,6 +119,16 @@ class TestInitState(unittest.TestCase):
         sim = get_simulation()
         self.assertGreater(len(sim.drivers), 0)
 
+    def test_init_state_gives_each_driver_its_own_behaviour(self):
+        """Every driver gets a separate behaviour instance, so thresholds can be tuned per driver."""
+        drivers_data = [{'id': i, 'x': float(i), 'y': 1.0} for i in range(30)]
+        init_state(drivers_data, [], timeout=1000, req_rate=0.0, width=50, height=50)
+
+        behaviours = [d.behaviour for d in get_simulation().drivers]
+        self.assertTrue({type(b).__name__ for b in behaviours}
+                        <= {'GreedyDistanceBehaviour', 'EarningsMaxBehaviour', 'LazyBehaviour'})
+        self.assertEqual(len({id(b) for b in behaviours}), len(behaviours))
+
     def test_init_state_with_requests(self):
         """init_state stores pre-loaded requests for time-based injection."""
         requests_data = [
@@ -120,6 +143,19 @@ class TestInitState(unittest.TestCase):
         self.assertTrue(hasattr(sim, '_all_csv_requests'))
         self.assertGreater(len(sim._all_csv_requests), 0)
 
+    def test_init_state_releases_unsorted_requests_by_time(self):
+        """Pre-loaded requests out of file order still arrive at their creation time."""
+        requests_data = [
+            {'id': 1, 'creation_time': 2, 'px': 5.0, 'py': 5.0, 'dx': 15.0, 'dy': 15.0},
+            {'id': 2, 'creation_time': 0, 'px': 6.0, 'py': 6.0, 'dx': 16.0, 'dy': 16.0},
+        ]
+        init_state(self.drivers_data, requests_data,
+                  timeout=1000, req_rate=1.0, width=50, height=50)
+
+        sim = get_simulation()
+        simulate_step({})
+        self.assertEqual([r.id for r in sim.requests], [2])
+
 
 class TestSimulateStep(unittest.TestCase):
     """Test simulate_step wrapper."""
@@ -163,6 +199,28 @@ class TestSimulateStep(unittest.TestCase):
             self.assertIn(key, state)
 
 
+class TestStepSimulation(unittest.TestCase):
+    """Test step_simulation assignment wrapper."""
+
+    def setUp(self):
+        """Initialize a simulation via the assignment wrapper."""
+        init_simulation([{'id': 1, 'x': 10.0, 'y': 20.0}], [],
+                        timeout=1000, req_rate=1.0, width=50, height=50)
+
+    def test_step_simulation_returns_time_and_metrics(self):
+        """step_simulation advances time and returns (time, metrics)."""
+        t, metrics = step_simulation()
+        self.assertEqual(t, 1)
+        self.assertEqual(set(metrics), {'served', 'expired', 'avg_wait'})
+        self.assertEqual(step_simulation()[0], 2)
+
+    def test_step_simulation_skips_state_dict(self):
+        """step_simulation does not build the GUI state dict."""
+        with patch('phase2.adapter.sim_to_state_dict') as mock_state:
+            step_simulation()
+        mock_state.assert_not_called()
+
+
 class TestGetPlotData(unittest.TestCase):
     """Test get_plot_data extraction."""
 
@@ -194,11 +252,22 @@ class TestGetPlotData(unittest.TestCase):
         
         self.assertIsInstance(drivers, (list, tuple))
 
+    def test_plot_data_buckets_requests_by_status(self):
+        """Waiting/assigned requests plot pickups, picked ones plot dropoffs, others are skipped."""
+        requests = [
+            Request(i, Point(4.0 * i + 1, 4.0 * i + 2), Point(4.0 * i + 3, 4.0 * i + 4), 0, status)
+            for i, status in enumerate((WAITING, ASSIGNED, PICKED, DELIVERED))
+        ]
+        sim = Mock(drivers=[], requests=requests)
+        _, pickups, dropoffs, _ = get_plot_data_from_simulation(sim)
+        self.assertEqual(pickups, [(1.0, 2.0), (5.0, 6.0)])
+        self.assertEqual(dropoffs, [(11.0, 12.0)])
+
     def test_get_plot_data_raises_if_not_initialized(self):
         """get_plot_data raises if simulation not initialized."""
         # Manually reset simulation
         import phase2.adapter as adapter_module
-        adapter_module._simulation = None
+        adapter_module._gui_session.simulation = None
         
         with self.assertRaises(RuntimeError):
             get_plot_data()
@@ -210,7 +279,7 @@ class TestGetSimulation(unittest.TestCase):
     def test_get_simulation_returns_none_initially(self):
         """get_simulation returns None if not initialized."""
         import phase2.adapter as adapter_module
-        adapter_module._simulation = None
+        adapter_module._gui_session.simulation = None
         
         result = get_simulation()
         self.assertIsNone(result)
@@ -233,7 +302,7 @@ class TestGetTimeSeries(unittest.TestCase):
     def test_get_time_series_returns_none_initially(self):
         """get_time_series returns None if not started."""
         import phase2.adapter as adapter_module
-        adapter_module._time_series = None
+        adapter_module._gui_session.time_series = None
         
         result = get_time_series()
         self.assertIsNone(result)
@@ -360,6 +429,100 @@ class TestAdapterIntegration(unittest.TestCase):
         state, _ = simulate_step(state)
         self.assertGreater(len(state.get('pending', [])), 0)
 
+    def test_finished_requests_leave_pending(self):
+        """Delivered and expired requests are not listed in the state's pending list."""
+        drivers_data = [{'id': 1, 'x': 40.0, 'y': 40.0}]
+        requests_data = [
+            {'id': 1, 'creation_time': 0, 'px': 5.0, 'py': 5.0, 'dx': 15.0, 'dy': 15.0},
+            {'id': 2, 'creation_time': 0, 'px': 6.0, 'py': 6.0, 'dx': 16.0, 'dy': 16.0},
+        ]
+        state = init_state(drivers_data, requests_data,
+                          timeout=1000, req_rate=0.0, width=50, height=50)
+        state, _ = simulate_step(state)
+        self.assertEqual({r['id'] for r in state['pending']}, {1, 2})
+
+        sim = get_simulation()
+        req = next(r for r in sim.requests if r.id == 1)
+        req.mark_expired(sim.time)
+        state = sim_to_state_dict(sim)
+        self.assertEqual([r['id'] for r in state['pending']], [2])
+
+
+class TestSimulationAdapter(unittest.TestCase):
+    """Test independent adapter sessions."""
+
+    def setUp(self):
+        self.drivers_data = [{'id': 1, 'x': 0.0, 'y': 0.0}]
+        self.requests_data = [{'id': 1, 't': 0, 'px': 3.0, 'py': 0.0, 'dx': 6.0, 'dy': 0.0}]
+
+    def test_sessions_are_independent(self):
+        """Two sessions and the module-level session advance separately."""
+        init_state(self.drivers_data, [], timeout=10, req_rate=0.0, width=50, height=50)
+        module_sim = get_simulation()
+
+        first, second = SimulationAdapter(), SimulationAdapter()
+        state = first.init_state(self.drivers_data, self.requests_data,
+                                 timeout=10, req_rate=0.0, width=50, height=50)
+        second.init_state(self.drivers_data, [], timeout=10, req_rate=0.0, width=50, height=50)
+        for _ in range(3):
+            state, metrics = first.simulate_step(state)
+
+        self.assertEqual(state['t'], 3)
+        self.assertEqual(len(first.time_series.times), 3)
+        self.assertEqual(second.simulation.time, 0)
+        self.assertIs(get_simulation(), module_sim)
+        self.assertEqual(module_sim.time, 0)
+
+    def test_step_and_plot_data(self):
+        """step_simulation and get_plot_data read this session's simulation."""
+        session = SimulationAdapter()
+        session.init_state(self.drivers_data, self.requests_data,
+                           timeout=10, req_rate=0.0, width=50, height=50)
+        t, metrics = session.step_simulation()
+        self.assertEqual(t, 1)
+        self.assertIn('served', metrics)
+        self.assertEqual(session.get_plot_data(),
+                         get_plot_data_from_simulation(session.simulation))
+
+    def test_uninitialized_session_raises(self):
+        """Stepping or plotting before init_state raises RuntimeError."""
+        session = SimulationAdapter()
+        with self.assertRaises(RuntimeError):
+            session.simulate_step(None)
+        with self.assertRaises(RuntimeError):
+            session.step_simulation()
+        with self.assertRaises(RuntimeError):
+            session.get_plot_data()
+
+    def test_backend_binds_session(self):
+        """The session backend routes init_state/simulate_step to the session."""
+        session = SimulationAdapter()
+        backend = session.backend()
+        self.assertEqual(set(backend), set(create_phase2_backend()))
+        state = backend['init_state'](self.drivers_data, [], 10, 0.0, 50, 50)
+        backend['simulate_step'](state)
+        self.assertEqual(session.simulation.time, 1)
+
+    def test_sessions_number_requests_independently(self):
+        """Each session's generate_requests keeps its own id counter."""
+        first, second = [], []
+        first_session, second_session = SimulationAdapter(), SimulationAdapter()
+        with patch('phase2.generator._generate_poisson', return_value=3):
+            first_session.generate_requests(0, first, 5.0, 40, 30)
+            second_session.backend()['generate_requests'](0, second, 5.0, 40, 30)
+            first_session.generate_requests(1, first, 5.0, 40, 30)
+        self.assertEqual([r['id'] for r in first], [1, 2, 3, 4, 5, 6])
+        self.assertEqual([r['id'] for r in second], [1, 2, 3])
+
+    def test_module_functions_drive_gui_session(self):
+        """Module-level init_state/step_simulation run the default session, separate from new ones."""
+        import phase2.adapter as adapter_module
+        init_state(self.drivers_data, [], timeout=10, req_rate=0.0, width=50, height=50)
+        step_simulation()
+        self.assertIs(adapter_module._gui_session.simulation, get_simulation())
+        self.assertEqual(get_simulation().time, 1)
+        self.assertIsNone(SimulationAdapter().simulation)
+
 
 class TestAdapterErrorHandling(unittest.TestCase):
     """Test error handling in adapter functions."""
@@ -383,7 +546,7 @@ class TestAdapterErrorHandling(unittest.TestCase):
     def test_get_plot_data_without_initialization(self):
         """get_plot_data raises error if simulation not initialized."""
         import phase2.adapter as adapter_module
-        adapter_module._simulation = None
+        adapter_module._gui_session.simulation = None
         
         with self.assertRaises(RuntimeError):
             get_plot_data()
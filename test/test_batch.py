@@ -0,0 +1,93 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from phase2.batch import run_one, run_batch, run_replications
+from phase2.helpers_2.metrics_helpers import SimulationTimeSeries
+import phase2.adapter as adapter_module
+
+
+class TestRunOne(unittest.TestCase):
+    """Test single replication runs."""
+
+    def test_returns_final_summary(self):
+        """run_one runs the full horizon and returns the final summary."""
+        result = run_one({"seed": 1, "horizon": 15})
+        self.assertEqual(result["total_time"], 15)
+        self.assertIn("final_served", result)
+        self.assertIn("service_level", result)
+
+    def test_same_seed_same_result(self):
+        """A seeded replication is reproducible."""
+        config = {"seed": 7, "horizon": 30, "n_drivers": 5}
+        self.assertEqual(run_one(config), run_one(config))
+
+    def test_explicit_drivers_and_requests(self):
+        """Given drivers and CSV-style requests are used instead of generated ones."""
+        config = {
+            "drivers": [{"id": 0, "x": 5.0, "y": 5.0}],
+            "requests": [{"id": 0, "t": 0, "px": 5.0, "py": 5.0, "dx": 6.0, "dy": 5.0}],
+            "horizon": 10,
+            "timeout": 20,
+            "seed": 3,
+        }
+        result = run_one(config)
+        self.assertEqual(result["total_requests"], result["final_served"] + result["final_expired"])
+        self.assertLessEqual(result["total_requests"], 1)
+
+    def test_seeded_run_keeps_caller_random_state(self):
+        """A seeded in-process run leaves the global random stream where it was."""
+        import random
+        random.seed(99)
+        expected = random.random()
+        random.seed(99)
+        run_one({"seed": 4, "horizon": 5})
+        self.assertEqual(random.random(), expected)
+
+    def test_does_not_touch_adapter_session(self):
+        """Batch runs leave the adapter's module-level simulation alone."""
+        adapter_module.init_state([{"id": 1, "x": 1.0, "y": 1.0}], [],
+                                  timeout=10, req_rate=0.0, width=50, height=30)
+        session = adapter_module.get_simulation()
+        run_one({"seed": 2, "horizon": 5})
+        self.assertIs(adapter_module.get_simulation(), session)
+        self.assertEqual(session.time, 0)
+
+
+class TestRunBatch(unittest.TestCase):
+    """Test multi-replication batches."""
+
+    def test_results_in_config_order(self):
+        """Process-pool results match running each config serially, in order."""
+        configs = [{"seed": s, "horizon": 20, "n_drivers": 4} for s in range(3)]
+        self.assertEqual(run_batch(configs, n_workers=2), [run_one(c) for c in configs])
+
+    def test_single_worker_runs_in_process(self):
+        """n_workers=1 runs serially and returns one summary per config."""
+        configs = [{"seed": s, "horizon": 5} for s in range(2)]
+        self.assertEqual(len(run_batch(configs, n_workers=1)), 2)
+
+    def test_empty_batch(self):
+        """No configs gives no results."""
+        self.assertEqual(run_batch([]), [])
+
+    def test_replications_return_time_series(self):
+        """run_replications hands back each run's full time series, in config order."""
+        configs = [{"seed": s, "horizon": 12, "n_drivers": 3} for s in range(5)]
+        series = run_replications(configs, n_workers=2)
+        self.assertEqual(len(series), 5)
+        for ts, config in zip(series, configs):
+            self.assertIsInstance(ts, SimulationTimeSeries)
+            self.assertEqual(len(ts.times), 12)
+            self.assertEqual(ts.get_final_summary(), run_one(config))
+
+    def test_invalid_worker_count_raises(self):
+        """Non-positive worker counts are rejected."""
+        with self.assertRaises(ValueError):
+            run_batch([{"horizon": 1}], n_workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
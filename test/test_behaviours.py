@@ -94,28 +94,40 @@ class TestGreedyDistanceBehaviour(unittest.TestCase):
         result = generous_behaviour.decide(self.driver, self.offer, time=0)
         self.assertTrue(result, "Large threshold should accept")
 
+    def test_changed_threshold_takes_effect(self):
+        """Test Reassigning max_distance updates the threshold decide() compares against."""
+        self.request.pickup = Point(8, 0)
+        self.behaviour.max_distance = 7.0
+        self.assertFalse(self.behaviour.decide(self.driver, self.offer, time=0))
+        self.behaviour.max_distance = 8.0
+        self.assertTrue(self.behaviour.decide(self.driver, self.offer, time=0))
+
     # ================================================================
     # TEST TYPE VALIDATION (TypeError Cases)
     # ================================================================
 
+    @unittest.skipUnless(__debug__, "decide() type checks are stripped under python -O")
     def test_type_error_invalid_driver_type(self):
         """Test Raise TypeError when driver is not Driver instance."""
         with self.assertRaises(TypeError) as context:
             self.behaviour.decide("invalid_driver", self.offer, time=0)
         self.assertIn("requires Driver", str(context.exception))
 
+    @unittest.skipUnless(__debug__, "decide() type checks are stripped under python -O")
     def test_type_error_invalid_offer_type(self):
         """Test Raise TypeError when offer is not Offer instance."""
         with self.assertRaises(TypeError) as context:
             self.behaviour.decide(self.driver, {}, time=0)
         self.assertIn("requires Offer", str(context.exception))
 
+    @unittest.skipUnless(__debug__, "decide() type checks are stripped under python -O")
     def test_type_error_invalid_time_type(self):
         """Test Raise TypeError when time is not int. """
         with self.assertRaises(TypeError) as context:
             self.behaviour.decide(self.driver, self.offer, time="invalid")
         self.assertIn("requires int time", str(context.exception))
 
+    @unittest.skipUnless(__debug__, "decide() type checks are stripped under python -O")
     def test_type_error_time_is_float(self):
         """Test Reject float time (must be int)."""
         with self.assertRaises(TypeError):
@@ -218,16 +230,19 @@ class TestEarningsMaxBehaviour(unittest.TestCase):
     # TEST TYPE VALIDATION
     # ================================================================
 
+    @unittest.skipUnless(__debug__, "decide() type checks are stripped under python -O")
     def test_type_error_invalid_driver(self):
         """Test: Raise TypeError for invalid driver."""
         with self.assertRaises(TypeError):
             self.behaviour.decide(None, self.offer, time=0)
 
+    @unittest.skipUnless(__debug__, "decide() type checks are stripped under python -O")
     def test_type_error_invalid_offer(self):
         """Test: Raise TypeError for invalid offer."""
         with self.assertRaises(TypeError):
             self.behaviour.decide(self.driver, [], time=0)
 
+    @unittest.skipUnless(__debug__, "decide() type checks are stripped under python -O")
     def test_type_error_invalid_time(self):
         """Test: Raise TypeError for non-int time."""
         with self.assertRaises(TypeError):
@@ -347,16 +362,19 @@ class TestLazyBehaviour(unittest.TestCase):
     # TEST TYPE VALIDATION
     # ================================================================
 
+    @unittest.skipUnless(__debug__, "decide() type checks are stripped under python -O")
     def test_type_error_invalid_driver(self):
         """Test: Raise TypeError for invalid driver."""
         with self.assertRaises(TypeError):
             self.behaviour.decide(123, self.offer, time=10)
 
+    @unittest.skipUnless(__debug__, "decide() type checks are stripped under python -O")
     def test_type_error_invalid_offer(self):
         """Test: Raise TypeError for invalid offer."""
         with self.assertRaises(TypeError):
             self.behaviour.decide(self.driver, "not_offer", time=10)
 
+    @unittest.skipUnless(__debug__, "decide() type checks are stripped under python -O")
     def test_type_error_invalid_time(self):
         """Test: Raise TypeError for non-int time."""
         with self.assertRaises(TypeError):
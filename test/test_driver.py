@@ -3,8 +3,7 @@ from phase2.driver import Driver, IDLE, TO_PICKUP, TO_DROPOFF
 from phase2.point import Point
 from phase2.request import Request, WAITING, ASSIGNED, PICKED, DELIVERED
 from phase2.helpers_2.core_helpers import (
-    is_at_target,
-    move_towards,
+    advance_towards,
     record_assignment_start,
     record_completion,
 )
@@ -18,86 +17,69 @@ def calculate_points(fare: float, wait_time: int) -> float:
 class TestPointHelpers(unittest.TestCase):
     """Test Point helper functions."""
 
-    def test_is_at_target_exact_match(self):
-        """Driver is at target when positions are identical."""
-        p1 = Point(5.0, 5.0)
-        p2 = Point(5.0, 5.0)
-        self.assertTrue(is_at_target(p1, p2))
-
-    def test_is_at_target_within_epsilon(self):
-        """Driver is at target when distance is within epsilon tolerance."""
-        p1 = Point(5.0, 5.0)
-        p2 = Point(5.0, 5.0 + 1e-10)  # Much less than EPSILON (1e-9)
-        self.assertTrue(is_at_target(p1, p2))
-
-    def test_is_at_target_outside_epsilon(self):
-        """Driver is NOT at target when distance exceeds epsilon."""
-        p1 = Point(0.0, 0.0)
-        p2 = Point(1.0, 0.0)
-        self.assertFalse(is_at_target(p1, p2))
-
-    def test_is_at_target_custom_tolerance(self):
-        """is_at_target respects custom tolerance parameter."""
-        p1 = Point(0.0, 0.0)
-        p2 = Point(0.5, 0.0)
-        self.assertFalse(is_at_target(p1, p2, tolerance=0.1))
-        self.assertTrue(is_at_target(p1, p2, tolerance=1.0))
-
-    def test_move_towards_zero_distance(self):
+    def test_advance_towards_zero_distance(self):
         """Moving zero distance returns current position."""
         current = Point(0.0, 0.0)
         target = Point(10.0, 0.0)
-        result = move_towards(current, target, 0.0)
+        result = advance_towards(current, target, 0.0)[0]
         self.assertEqual(result, current)
 
-    def test_move_towards_partial_distance(self):
+    def test_advance_towards_partial_distance(self):
         """Moving partial distance interpolates correctly."""
         current = Point(0.0, 0.0)
         target = Point(10.0, 0.0)
-        result = move_towards(current, target, 5.0)
+        result = advance_towards(current, target, 5.0)[0]
         self.assertEqual(result.x, 5.0)
         self.assertEqual(result.y, 0.0)
 
-    def test_move_towards_exact_distance(self):
+    def test_advance_towards_exact_distance(self):
         """Moving exact distance reaches target."""
         current = Point(0.0, 0.0)
         target = Point(10.0, 0.0)
-        result = move_towards(current, target, 10.0)
+        result = advance_towards(current, target, 10.0)[0]
         self.assertAlmostEqual(result.x, 10.0, places=9)
         self.assertAlmostEqual(result.y, 0.0, places=9)
 
-    def test_move_towards_overshooting_prevented(self):
+    def test_advance_towards_overshooting_prevented(self):
         """Moving more than target distance doesn't overshoot."""
         current = Point(0.0, 0.0)
         target = Point(10.0, 0.0)
-        result = move_towards(current, target, 20.0)
+        result = advance_towards(current, target, 20.0)[0]
         # Should be clamped at target
         self.assertAlmostEqual(result.x, 10.0, places=9)
         self.assertAlmostEqual(result.y, 0.0, places=9)
 
-    def test_move_towards_diagonal(self):
+    def test_advance_towards_arrival_lands_exactly_on_target(self):
+        """Reaching the target returns its exact coordinates (no rounding drift)."""
+        current = Point(4.692979338711744, 0.0)
+        target = Point(1.4173738261003155, 0.0)
+        result = advance_towards(current, target, 5.0)[0]
+        self.assertEqual(result.x, target.x)
+        self.assertEqual(result.y, target.y)
+
+    def test_advance_towards_diagonal(self):
         """Moving towards diagonal target works correctly."""
         current = Point(0.0, 0.0)
         target = Point(3.0, 4.0)  # Distance = 5.0
-        result = move_towards(current, target, 2.5)
+        result = advance_towards(current, target, 2.5)[0]
         # Should move halfway (2.5 / 5.0 = 0.5 of the way)
         self.assertAlmostEqual(result.x, 1.5, places=9)
         self.assertAlmostEqual(result.y, 2.0, places=9)
 
-    def test_move_towards_already_at_target(self):
+    def test_advance_towards_already_at_target(self):
         """Moving when already at target returns a copy of current."""
         current = Point(5.0, 5.0)
         target = Point(5.0, 5.0)
-        result = move_towards(current, target, 10.0)
+        result = advance_towards(current, target, 10.0)[0]
         self.assertEqual(result.x, current.x)
         self.assertEqual(result.y, current.y)
 
-    def test_move_towards_negative_distance_raises(self):
+    def test_advance_towards_negative_distance_raises(self):
         """Negative distance raises ValueError."""
         current = Point(0.0, 0.0)
         target = Point(10.0, 0.0)
         with self.assertRaises(ValueError):
-            move_towards(current, target, -1.0)
+            advance_towards(current, target, -1.0)
 
 
 class TestHistoryRecording(unittest.TestCase):
@@ -215,6 +197,13 @@ class TestDriverBasics(unittest.TestCase):
         self.driver.assign_request(request, current_time=0)
         self.assertFalse(self.driver.is_idle())
 
+    def test_driver_is_slotted(self):
+        """Driver has no per-instance __dict__ and starts with no mutation recorded."""
+        self.assertFalse(hasattr(self.driver, "__dict__"))
+        self.assertEqual(self.driver._last_mutation_time, -float("inf"))
+        with self.assertRaises(AttributeError):
+            self.driver.unknown_attribute = 1
+
 
 class TestDriverAssignment(unittest.TestCase):
     """Test driver request assignment."""
@@ -347,6 +336,20 @@ class TestDriverMovement(unittest.TestCase):
         self.assertAlmostEqual(self.driver.position.x, 10.0, places=9)
         self.assertAlmostEqual(self.driver.position.y, 0.0, places=9)
 
+    def test_step_at_target_no_movement(self):
+        """Step leaves a driver that is already at its target in place."""
+        self.driver.position = Point(10.0, 0.0)
+        self.driver.assign_request(self.request, current_time=0)
+        self.driver.step(dt=1.0)
+        self.assertEqual(self.driver.position, Point(10.0, 0.0))
+
+    def test_step_returns_distance_left(self):
+        """Step reports the distance still left to the target (inf with no target)."""
+        self.assertEqual(self.driver.step(dt=1.0), float("inf"))
+        self.driver.assign_request(self.request, current_time=0)
+        self.assertAlmostEqual(self.driver.step(dt=1.0), 5.0, places=9)
+        self.assertEqual(self.driver.step(dt=1.0), 0.0)
+
 
 class TestDriverPickupAndDropoff(unittest.TestCase):
     """Test driver pickup and dropoff operations."""
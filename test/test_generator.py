@@ -93,6 +93,13 @@ class TestMaybeGenerate(unittest.TestCase):
         result = gen.maybe_generate(time=0)
         self.assertEqual(result, [])
 
+    @patch('phase2.generator._generate_poisson')
+    def test_zero_rate_skips_sampling(self, mock_poisson):
+        """Zero rate returns before drawing a Poisson count."""
+        gen = RequestGenerator(rate=0, width=100, height=100)
+        self.assertEqual(gen.maybe_generate(time=3), [])
+        mock_poisson.assert_not_called()
+
     def test_returns_list(self):
         """Should return a list."""
         gen = RequestGenerator(rate=2.0, width=100, height=100)
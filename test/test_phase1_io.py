@@ -2,17 +2,17 @@ import unittest
 import tempfile
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 # Phase 1 modules
 from phase1.io_mod import load_drivers, load_requests, generate_drivers, generate_requests
 from phase1.helpers_1.load_helper import (
     read_csv_lines, parse_csv_line, parse_float, parse_driver_row,
     parse_request_row, validate_coordinate, validate_time, validate_row_length,
-    file_exists
+    file_exists, parse_driver_rows, parse_request_rows, iter_csv_bytes
 )
 from phase1.helpers_1.generate_helper import (
-    generate_request_count, create_random_position, create_driver_dict,
-    create_request_dict
+    generate_request_count, create_request_dicts, create_driver_dicts
 )
 
 
@@ -98,6 +98,39 @@ class TestReadCSVLines(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             read_csv_lines("/nonexistent/path/file.csv")
 
+    def test_iter_csv_bytes_streams_filtered_lines(self):
+        """iter_csv_bytes yields the same lines as read_csv_lines, as bytes."""
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False) as f:
+            f.write(b"# header\n1,2\n\n  3,4  \n#skip\n5,6")
+            temp_path = f.name
+
+        try:
+            self.assertEqual(list(iter_csv_bytes(temp_path)), [b"1,2", b"3,4", b"5,6"])
+            self.assertEqual(read_csv_lines(temp_path), ["1,2", "3,4", "5,6"])
+        finally:
+            os.unlink(temp_path)
+
+    def test_read_empty_file(self):
+        """read_csv_lines returns no lines for a zero-byte file."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            temp_path = f.name
+
+        try:
+            self.assertEqual(read_csv_lines(temp_path), [])
+        finally:
+            os.unlink(temp_path)
+
+    def test_read_csv_crlf_and_no_trailing_newline(self):
+        """read_csv_lines handles CRLF endings and a final line without newline."""
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False) as f:
+            f.write(b"# header\r\n1,2\r\n3,4")
+            temp_path = f.name
+
+        try:
+            self.assertEqual(read_csv_lines(temp_path), ["1,2", "3,4"])
+        finally:
+            os.unlink(temp_path)
+
 
 # ====================================================================
 # Float Parsing Tests
@@ -275,12 +308,28 @@ class TestParseRequestRow(unittest.TestCase):
         with self.assertRaises(ValueError):
             parse_request_row(row, 2)
     
+    def test_parse_request_row_decimal_time_rejected(self):
+        """parse_request_row requires an integer tick time."""
+        row = ["2.5", "10", "15", "20", "25"]
+        with self.assertRaises(ValueError) as ctx:
+            parse_request_row(row, 4)
+        self.assertIn("Line 4", str(ctx.exception))
+    
     def test_parse_request_row_out_of_bounds_pickup(self):
         """parse_request_row rejects out-of-bounds pickup."""
         row = ["5", "-1", "15", "20", "25"]
         with self.assertRaises(ValueError):
             parse_request_row(row, 2)
     
+    def test_parse_request_row_bounds_message_matches_validate_coordinate(self):
+        """parse_request_row reports bounds errors in validate_coordinate's format."""
+        row = ["5", "10", "15", "20", "60"]
+        with self.assertRaises(ValueError) as row_ctx:
+            parse_request_row(row, 3)
+        with self.assertRaises(ValueError) as helper_ctx:
+            validate_coordinate(60.0, 'dy', 3)
+        self.assertEqual(str(row_ctx.exception), str(helper_ctx.exception))
+    
     def test_parse_request_row_insufficient_fields(self):
         """parse_request_row requires 5 fields."""
         row = ["5", "10", "15", "20"]
@@ -333,6 +382,57 @@ class TestLoadDrivers(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             load_drivers("/nonexistent/file.csv")
 
+    def test_load_drivers_invalid_row_reports_line(self):
+        """load_drivers falls back to per-row parsing to report the bad line."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write("10.0,20.0\n")
+            f.write("30.0,99.0\n")
+            f.flush()
+            temp_path = f.name
+
+        try:
+            with self.assertRaises(ValueError) as ctx:
+                load_drivers(temp_path)
+            self.assertIn("Line 3", str(ctx.exception))
+            self.assertIn("out of bounds", str(ctx.exception))
+        finally:
+            os.unlink(temp_path)
+
+    def test_parse_driver_rows_matches_per_row_parse(self):
+        """parse_driver_rows builds the same dicts as parse_driver_row."""
+        lines = ["10.0,20.0", "0,50", " 5 , 6 "]
+        fast = parse_driver_rows(lines)
+        expected = [dict(parse_driver_row(parse_csv_line(l), i + 2), id=i)
+                    for i, l in enumerate(lines)]
+        self.assertEqual(fast, expected)
+
+    def test_load_drivers_row_with_empty_field(self):
+        """load_drivers still accepts rows with empty fields via the per-row path."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write("10.0,,20.0\n")
+            f.write(",\n")
+            f.write("30.0,40.0\n")
+            f.flush()
+            temp_path = f.name
+
+        try:
+            drivers = load_drivers(temp_path)
+            self.assertEqual([(d["x"], d["y"], d["id"]) for d in drivers],
+                             [(10.0, 20.0, 0), (30.0, 40.0, 1)])
+        finally:
+            os.unlink(temp_path)
+
+    def test_parse_driver_rows_accepts_bytes(self):
+        """parse_driver_rows parses bytes lines when given a bytes separator."""
+        self.assertEqual(parse_driver_rows([b"10.0,20.0", b" 5 , 6 "], sep=b','),
+                         parse_driver_rows(["10.0,20.0", " 5 , 6 "]))
+
+    def test_parse_driver_rows_returns_none_on_invalid_row(self):
+        """parse_driver_rows signals invalid input with None."""
+        self.assertIsNone(parse_driver_rows(["10,20", "abc,1"]))
+        self.assertIsNone(parse_driver_rows(["10"]))
+        self.assertIsNone(parse_driver_rows(["-1,20"]))
+
 
 class TestLoadRequests(unittest.TestCase):
     """Test request CSV loading."""
@@ -370,6 +470,39 @@ class TestLoadRequests(unittest.TestCase):
         finally:
             os.unlink(temp_path)
 
+    def test_load_requests_invalid_row_reports_line(self):
+        """load_requests falls back to per-row parsing to report the bad line."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write("0,1,2,3,4\n")
+            f.write("5,10,15,20,51\n")
+            f.flush()
+            temp_path = f.name
+
+        try:
+            with patch('builtins.print'):
+                with self.assertRaises(ValueError) as ctx:
+                    load_requests(temp_path)
+            self.assertIn("Line 3", str(ctx.exception))
+            self.assertIn("'dy'", str(ctx.exception))
+        finally:
+            os.unlink(temp_path)
+
+    def test_parse_request_rows_matches_per_row_parse(self):
+        """parse_request_rows builds the same dicts as parse_request_row."""
+        lines = ["0,1,2,3,4", "5,10,15,20,25", " 7 , 0 , 50 , 0 , 50 "]
+        fast = parse_request_rows(lines)
+        expected = [{"id": i, **parse_request_row(parse_csv_line(l), i + 2)}
+                    for i, l in enumerate(lines)]
+        self.assertEqual(fast, expected)
+
+    def test_parse_request_rows_returns_none_on_invalid_row(self):
+        """parse_request_rows signals invalid input with None."""
+        self.assertIsNone(parse_request_rows(["0,1,2,3,4", "x,1,2,3,4"]))
+        self.assertIsNone(parse_request_rows(["0,1,2,3"]))
+        self.assertIsNone(parse_request_rows(["-1,1,2,3,4"]))
+        self.assertIsNone(parse_request_rows(["0,nan,2,3,4"]))
+        self.assertIsNone(parse_request_rows(["1.5,1,2,3,4"]))
+
 
 # ====================================================================
 # Poisson Generation Tests
@@ -397,6 +530,18 @@ class TestGenerateRequestCount(unittest.TestCase):
         # Average should be approximately equal to rate (within tolerance)
         self.assertAlmostEqual(average, rate, delta=0.5)
     
+    def test_large_rate_average(self):
+        """generate_request_count stays accurate above the Knuth chunk size."""
+        import random
+        random.seed(7)
+        
+        rate = 1000.0
+        counts = [generate_request_count(rate) for _ in range(200)]
+        average = sum(counts) / len(counts)
+        
+        # Standard error is sqrt(1000 / 200) ~ 2.2
+        self.assertAlmostEqual(average, rate, delta=15)
+    
     def test_negative_rate_raises(self):
         """generate_request_count rejects negative rates."""
         with self.assertRaises(ValueError):
@@ -414,134 +559,105 @@ class TestGenerateRequestCount(unittest.TestCase):
         self.assertTrue(any(c > 0 for c in counts))
         self.assertTrue(any(c > 1 for c in counts))
 
-
-# ====================================================================
-# Random Position Generation Tests
-# ====================================================================
-
-class TestCreateRandomPosition(unittest.TestCase):
-    """Test random position generation."""
-    
-    def test_position_within_bounds(self):
-        """create_random_position generates positions within grid bounds."""
-        import random
-        random.seed(42)
-        
-        width, height = 50, 30
-        for _ in range(100):
-            x, y = create_random_position(width, height)
-            self.assertGreaterEqual(x, 0)
-            self.assertLessEqual(x, width)
-            self.assertGreaterEqual(y, 0)
-            self.assertLessEqual(y, height)
-    
-    def test_position_variety(self):
-        """create_random_position generates different positions."""
-        import random
-        random.seed(42)
-        
-        positions = [create_random_position(50, 30) for _ in range(10)]
-        # All positions should be different (very unlikely to get duplicates)
-        self.assertEqual(len(positions), len(set(positions)))
+    def test_patched_random_is_used(self):
+        """generate_request_count draws from random.random at call time, so patching works."""
+        # First draw already falls below exp(-1): zero arrivals
+        with patch('random.random', return_value=0.0):
+            self.assertEqual(generate_request_count(1.0), 0)
 
 
 # ====================================================================
 # Driver Dictionary Generation Tests
 # ====================================================================
 
-class TestCreateDriverDict(unittest.TestCase):
+class TestCreateDriverDicts(unittest.TestCase):
     """Test driver dictionary creation."""
     
-    def test_create_driver_dict_structure(self):
-        """create_driver_dict has all required fields."""
-        import random
-        random.seed(42)
-        
-        driver = create_driver_dict(5, 50, 30)
+    def test_create_driver_dicts_structure(self):
+        """create_driver_dicts builds one driver per position with ids 0..n-1 and all fields."""
+        drivers = create_driver_dicts([(1.0, 2.0), (3.0, 4.0)])
         
-        self.assertEqual(driver["id"], 5)
-        self.assertIn("x", driver)
-        self.assertIn("y", driver)
-        self.assertIn("speed", driver)
-        self.assertIn("vx", driver)
-        self.assertIn("vy", driver)
-        self.assertIn("target_id", driver)
+        self.assertEqual([(d["id"], d["x"], d["y"]) for d in drivers], [(0, 1.0, 2.0), (1, 3.0, 4.0)])
+        for driver in drivers:
+            self.assertIn("speed", driver)
+            self.assertIn("vx", driver)
+            self.assertIn("vy", driver)
+            self.assertIn("target_id", driver)
     
     def test_driver_initial_state(self):
-        """create_driver_dict initializes state correctly."""
-        import random
-        random.seed(42)
-        
-        driver = create_driver_dict(0, 50, 30)
+        """create_driver_dicts initializes state correctly."""
+        driver = create_driver_dicts([(0.0, 0.0)])[0]
         
         # Initial velocities should be zero
         self.assertEqual(driver["vx"], 0.0)
         self.assertEqual(driver["vy"], 0.0)
         # No target initially
         self.assertIsNone(driver["target_id"])
+        self.assertIsNone(driver["tx"])
+        self.assertIsNone(driver["request_id"])
+        self.assertEqual(driver["status"], "idle")
     
     def test_driver_speed_range(self):
-        """create_driver_dict generates speed in expected range."""
+        """create_driver_dicts generates speed in expected range."""
         import random
         random.seed(42)
         
-        speeds = [create_driver_dict(i, 50, 30)["speed"] for i in range(100)]
-        
-        for speed in speeds:
-            self.assertGreaterEqual(speed, 0.8)
-            self.assertLessEqual(speed, 1.6)
-    
-    def test_driver_position_within_grid(self):
-        """create_driver_dict generates position within grid."""
-        import random
-        random.seed(42)
-        
-        width, height = 50, 30
-        drivers = [create_driver_dict(i, width, height) for i in range(50)]
+        drivers = create_driver_dicts([(0.0, 0.0)] * 100)
         
         for driver in drivers:
-            self.assertGreaterEqual(driver["x"], 0)
-            self.assertLessEqual(driver["x"], width)
-            self.assertGreaterEqual(driver["y"], 0)
-            self.assertLessEqual(driver["y"], height)
+            self.assertGreaterEqual(driver["speed"], 0.8)
+            self.assertLessEqual(driver["speed"], 1.6)
+    
+    def test_create_driver_dicts_returns_independent_dicts(self):
+        """create_driver_dicts returns a fresh dict per driver."""
+        drivers = create_driver_dicts([(1.0, 2.0), (3.0, 4.0)])
+        drivers[0]["status"] = "busy"
+        self.assertEqual(drivers[1]["status"], "idle")
+        self.assertIsNot(drivers[0], drivers[1])
 
 
 # ====================================================================
 # Request Dictionary Generation Tests
 # ====================================================================
 
-class TestCreateRequestDict(unittest.TestCase):
+class TestCreateRequestDicts(unittest.TestCase):
     """Test request dictionary creation."""
     
-    def test_create_request_dict_structure(self):
-        """create_request_dict has all required fields."""
-        import random
-        random.seed(42)
+    def test_create_request_dicts_structure(self):
+        """create_request_dicts builds n waiting requests with tick ids and all fields."""
+        reqs = create_request_dicts(5, 7, 50, 30)
         
-        req = create_request_dict(1, 0, 50, 30)
-        
-        self.assertEqual(req["id"], 1)
-        self.assertEqual(req["t"], 0)
-        self.assertIn("px", req)
-        self.assertIn("py", req)
-        self.assertIn("dx", req)
-        self.assertIn("dy", req)
+        self.assertEqual([r["id"] for r in reqs], [f"7_{i}" for i in range(5)])
+        for req in reqs:
+            self.assertEqual(req["t"], 7)
+            self.assertEqual(req["status"], "waiting")
+            self.assertIn("px", req)
+            self.assertIn("py", req)
+            self.assertIn("dx", req)
+            self.assertIn("dy", req)
+    
+    def test_create_request_dicts_returns_independent_dicts(self):
+        """create_request_dicts returns a fresh dict per request."""
+        first, second = create_request_dicts(2, 0, 50, 30)
+        first["status"] = "assigned"
+        self.assertEqual(second["status"], "waiting")
+        self.assertIsNot(first, second)
     
     def test_request_within_grid(self):
-        """create_request_dict generates positions within grid."""
+        """create_request_dicts generates positions within grid."""
         import random
         random.seed(42)
         
         width, height = 50, 30
-        for _ in range(50):
-            req = create_request_dict(1, 0, width, height)
-            
+        for req in create_request_dicts(50, 0, width, height):
             self.assertGreaterEqual(req["px"], 0)
             self.assertLessEqual(req["px"], width)
             self.assertGreaterEqual(req["py"], 0)
             self.assertLessEqual(req["py"], height)
             self.assertGreaterEqual(req["dx"], 0)
             self.assertLessEqual(req["dx"], width)
+            self.assertGreaterEqual(req["dy"], 0)
+            self.assertLessEqual(req["dy"], height)
 
 
 # ====================================================================
@@ -567,6 +683,20 @@ class TestGenerateDrivers(unittest.TestCase):
         drivers = generate_drivers(0, 50, 30)
         self.assertEqual(len(drivers), 0)
 
+    def test_generate_drivers_distinct_cells_in_bounds(self):
+        """generate_drivers places drivers on distinct integer cells inside the grid."""
+        drivers = generate_drivers(12, 4, 3)
+        cells = {(d["x"], d["y"]) for d in drivers}
+        self.assertEqual(len(cells), 12)
+        for x, y in cells:
+            self.assertTrue(0 <= x < 4 and 0 <= y < 3)
+            self.assertEqual(x, int(x))
+
+    def test_generate_drivers_more_than_cells_raises(self):
+        """generate_drivers raises ValueError when the grid has too few cells."""
+        with self.assertRaises(ValueError):
+            generate_drivers(13, 4, 3)
+
 
 class TestGenerateRequests(unittest.TestCase):
     """Test request generation function."""
@@ -588,5 +718,21 @@ class TestGenerateRequests(unittest.TestCase):
         self.assertEqual(len(out_list), 0)
 
 
+class TestPhase1Backend(unittest.TestCase):
+    """Test the canonical backend dict in phase1.phase1."""
+
+    def test_backend_wires_io_and_sim_functions(self):
+        """backend maps the six GUI names to the phase1 io_mod/sim_mod functions."""
+        from phase1 import sim_mod
+        from phase1.phase1 import backend
+        self.assertEqual(set(backend), {
+            "load_drivers", "load_requests", "generate_drivers",
+            "generate_requests", "init_state", "simulate_step",
+        })
+        self.assertIs(backend["load_drivers"], load_drivers)
+        self.assertIs(backend["generate_requests"], generate_requests)
+        self.assertIs(backend["simulate_step"], sim_mod.simulate_step)
+
+
 if __name__ == '__main__':
     unittest.main()
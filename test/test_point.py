@@ -78,6 +78,19 @@ class TestPointDistance(unittest.TestCase):
         with self.assertRaises(TypeError):
             p.distance_to("not a point")
 
+    def test_distance_sq_matches_squared_distance(self):
+        """distance_sq_to() returns the squared Euclidean distance."""
+        p1 = Point(0, 0)
+        p2 = Point(3, 4)
+        self.assertEqual(p1.distance_sq_to(p2), 25.0)
+        self.assertEqual(p2.distance_sq_to(p1), 25.0)
+
+    def test_distance_sq_type_error_with_string(self):
+        """TypeError when distance_sq_to() called with string."""
+        p = Point(0, 0)
+        with self.assertRaises(TypeError):
+            p.distance_sq_to("not a point")
+
 
 # ====================================================================
 # TEST: __add__() Method (Vector Addition)
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 import sys
 import os
 
@@ -9,6 +9,7 @@ from phase2.policies import DispatchPolicy, NearestNeighborPolicy, GlobalGreedyP
 from phase2.driver import Driver, IDLE, TO_PICKUP
 from phase2.request import Request, WAITING, PICKED
 from phase2.point import Point
+from phase2.helpers_2.spatial_helpers import SpatialGrid, LinearScan, suggest_cell_size
 
 
 class TestDispatchPolicyBase(unittest.TestCase):
@@ -100,6 +101,30 @@ class TestNearestNeighborPolicy(unittest.TestCase):
         driver_ids = [p[0].id for p in result]
         self.assertEqual(len(driver_ids), len(set(driver_ids)))
 
+    def test_closest_pair_is_chosen_first(self):
+        """Globally closest pair is matched before the others."""
+        d1 = Mock(spec=Driver, status=IDLE, position=Point(0, 0), id=1)
+        d2 = Mock(spec=Driver, status=IDLE, position=Point(10, 0), id=2)
+        r1 = Mock(spec=Request, status=WAITING, pickup=Point(9, 0), id=1)
+        r2 = Mock(spec=Request, status=WAITING, pickup=Point(4, 0), id=2)
+
+        result = self.policy.assign([d1, d2], [r1, r2], 0)
+
+        # d2-r1 (distance 1) is picked first, leaving d1-r2
+        self.assertEqual(result, [(d2, r1), (d1, r2)])
+
+    def test_driver_falls_back_when_nearest_request_taken(self):
+        """Driver whose nearest request is taken gets its next-nearest one."""
+        d1 = Mock(spec=Driver, status=IDLE, position=Point(0, 0), id=1)
+        d2 = Mock(spec=Driver, status=IDLE, position=Point(10, 0), id=2)
+        r1 = Mock(spec=Request, status=WAITING, pickup=Point(3, 0), id=1)
+        r2 = Mock(spec=Request, status=WAITING, pickup=Point(25, 0), id=2)
+
+        result = self.policy.assign([d1, d2], [r1, r2], 0)
+
+        # Both drivers prefer r1; d1 is closer, so d2 moves on to r2
+        self.assertEqual(result, [(d1, r1), (d2, r2)])
+
 
 class TestGlobalGreedyPolicy(unittest.TestCase):
     """Test GlobalGreedyPolicy dispatch logic."""
@@ -197,6 +222,30 @@ class TestGlobalGreedyPolicy(unittest.TestCase):
 
         self.assertEqual(len(result), 1)
 
+    def test_random_fleet_matches_reference(self):
+        """Flat-coordinate matching equals sorting every (driver, request) pair by distance."""
+        import random
+        rng = random.Random(5)
+        drivers = [Mock(spec=Driver, status=IDLE, position=Point(rng.uniform(0, 50), rng.uniform(0, 30)), id=i)
+                   for i in range(12)]
+        requests = [Mock(spec=Request, status=WAITING, pickup=Point(rng.uniform(0, 50), rng.uniform(0, 30)), id=i)
+                    for i in range(9)]
+
+        pairs = sorted(((d, r) for d in drivers for r in requests),
+                       key=lambda p: p[0].position.distance_to(p[1].pickup))
+        used_d, used_r, expected = set(), set(), []
+        for d, r in pairs:
+            if d.id in used_d or r.id in used_r:
+                continue
+            expected.append((d, r))
+            used_d.add(d.id)
+            used_r.add(r.id)
+
+        # Both the flat pair list and the shared closest-pair matcher
+        for cutoff in (len(drivers) + 1, 0):
+            with self.subTest(cutoff=cutoff), patch("phase2.policies.GLOBAL_GREEDY_MIN_DRIVERS", cutoff):
+                self.assertEqual(self.policy.assign(drivers, requests, 0), expected)
+
 
 class TestPolicyComparison(unittest.TestCase):
     """Compare behavior of different policies."""
@@ -224,5 +273,121 @@ class TestPolicyComparison(unittest.TestCase):
         self.assertEqual(gg.assign([], [], 0), [])
 
 
+class TestSpatialGrid(unittest.TestCase):
+    """Test the uniform bucket grid used for nearest-driver lookups."""
+
+    def test_empty_grid_returns_no_match(self):
+        """nearest() on an empty grid returns (-1, inf)."""
+        grid = SpatialGrid(1.0)
+        idx, dist_sq = grid.nearest(5.0, 5.0)
+        self.assertEqual(idx, -1)
+        self.assertEqual(dist_sq, float("inf"))
+
+    def test_invalid_cell_size_raises(self):
+        """Cell size must be positive."""
+        with self.assertRaises(ValueError):
+            SpatialGrid(0.0)
+
+    def test_nearest_matches_brute_force(self):
+        """nearest() agrees with a full scan, including after removals."""
+        import random
+        rng = random.Random(7)
+        xs = [rng.uniform(0, 50) for _ in range(60)]
+        ys = [rng.uniform(0, 30) for _ in range(60)]
+        grid = SpatialGrid(suggest_cell_size(xs, ys))
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            grid.insert(i, x, y)
+        for i in range(0, 60, 3):
+            grid.remove(i)
+        remaining = [i for i in range(60) if i % 3]
+
+        for _ in range(100):
+            qx, qy = rng.uniform(-5, 55), rng.uniform(-5, 35)
+            expected = min(remaining, key=lambda i: ((xs[i] - qx) ** 2 + (ys[i] - qy) ** 2, i))
+            idx, _ = grid.nearest(qx, qy)
+            self.assertEqual(idx, expected)
+
+    def test_tie_broken_by_lowest_index(self):
+        """Equidistant points resolve to the lowest index."""
+        grid = SpatialGrid(1.0)
+        grid.insert(3, 2.0, 0.0)
+        grid.insert(1, -2.0, 0.0)
+        self.assertEqual(grid.nearest(0.0, 0.0), (1, 4.0))
+
+
+class TestLinearScan(unittest.TestCase):
+    """Test the plain-scan index used for small fleets."""
+
+    def test_matches_spatial_grid(self):
+        """LinearScan and SpatialGrid agree on nearest(), including after removals."""
+        import random
+        rng = random.Random(3)
+        grid = SpatialGrid(5.0)
+        scan = LinearScan()
+        for i in range(20):
+            x, y = rng.uniform(0, 50), rng.uniform(0, 30)
+            grid.insert(i, x, y)
+            scan.insert(i, x, y)
+        for i in (0, 4, 9):
+            grid.remove(i)
+            scan.remove(i)
+        self.assertEqual(len(scan), 17)
+        self.assertNotIn(4, scan)
+        for _ in range(50):
+            qx, qy = rng.uniform(0, 50), rng.uniform(0, 30)
+            self.assertEqual(scan.nearest(qx, qy), grid.nearest(qx, qy))
+
+    def test_empty_and_ties(self):
+        """Empty scan returns (-1, inf); ties resolve to the lowest index."""
+        scan = LinearScan()
+        self.assertEqual(scan.nearest(0.0, 0.0), (-1, float("inf")))
+        scan.insert(3, 2.0, 0.0)
+        scan.insert(1, -2.0, 0.0)
+        self.assertEqual(scan.nearest(0.0, 0.0), (1, 4.0))
+
+
+class TestNearestNeighborMatchesBruteForce(unittest.TestCase):
+    """NearestNeighborPolicy matches the plain repeated closest-pair search."""
+
+    def test_random_fleet_matches_reference(self):
+        """Grid-based matching equals the O(n*m) per-round reference."""
+        import random
+        rng = random.Random(11)
+        drivers = [Mock(spec=Driver, status=IDLE, position=Point(rng.uniform(0, 50), rng.uniform(0, 30)), id=i)
+                   for i in range(25)]
+        requests = [Mock(spec=Request, status=WAITING, pickup=Point(rng.uniform(0, 50), rng.uniform(0, 30)), id=i)
+                    for i in range(18)]
+
+        # Reference: repeatedly take the globally closest remaining pair
+        idle, waiting, expected = list(drivers), list(requests), []
+        while idle and waiting:
+            d, r = min(((d, r) for d in idle for r in waiting),
+                       key=lambda p: p[0].position.distance_to(p[1].pickup))
+            expected.append((d, r))
+            idle.remove(d)
+            waiting.remove(r)
+
+        # Force the bucket-grid path; a fleet this small would otherwise use the scan
+        with patch("phase2.policies.GRID_MIN_DRIVERS", 0):
+            self.assertEqual(NearestNeighborPolicy().assign(drivers, requests, 0), expected)
+
+    def test_small_fleet_matches_reference(self):
+        """Below GRID_MIN_DRIVERS the plain-scan path gives the same greedy matching."""
+        drivers = [Mock(spec=Driver, status=IDLE, position=Point(float(i * 7 % 11), float(i)), id=i)
+                   for i in range(5)]
+        requests = [Mock(spec=Request, status=WAITING, pickup=Point(float(j * 3), float(j % 4)), id=j)
+                    for j in range(6)]
+
+        idle, waiting, expected = list(drivers), list(requests), []
+        while idle and waiting:
+            d, r = min(((d, r) for d in idle for r in waiting),
+                       key=lambda p: p[0].position.distance_to(p[1].pickup))
+            expected.append((d, r))
+            idle.remove(d)
+            waiting.remove(r)
+
+        self.assertEqual(NearestNeighborPolicy().assign(drivers, requests, 0), expected)
+
+
 if __name__ == '__main__':
     unittest.main()
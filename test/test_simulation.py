@@ -125,7 +125,6 @@ class TestDeliverySimulationInit(unittest.TestCase):
         self.assertEqual(sim.served_count, 0)
         self.assertEqual(sim.expired_count, 0)
         self.assertEqual(sim.avg_wait, 0.0)
-        self.assertEqual(len(sim._wait_samples), 0)
         self.assertIsNotNone(sim.earnings_by_behaviour)
 
     def test_init_stores_dependencies(self):
@@ -414,6 +413,23 @@ class TestGetSnapshot(unittest.TestCase):
         self.assertIn("tx", driver_snap)
         self.assertIn("ty", driver_snap)
 
+    def test_driver_rows_reused_until_driver_changes(self):
+        """An unchanged driver keeps its row; moving or taking a job rebuilds it."""
+        first = self.sim.driver_snapshots()[0]
+        self.assertIs(self.sim.driver_snapshots()[0], first)
+
+        request = create_mock_request(7, px=4.0, py=2.0)
+        self.driver.assign_request(request, 0)
+        assigned = self.sim.driver_snapshots()[0]
+        self.assertIsNot(assigned, first)
+        self.assertEqual((assigned["rid"], assigned["tx"], assigned["ty"]), (7, 4.0, 2.0))
+
+        self.driver.step(1.0)
+        moved = self.sim.driver_snapshots()[0]
+        self.assertIsNot(moved, assigned)
+        self.assertGreater(moved["x"], 1.0)
+        self.assertEqual(first["x"], 1.0)
+
     def test_snapshot_empty_pickups_initially(self):
         """No pickup locations initially."""
         snapshot = self.sim.get_snapshot()
@@ -498,6 +514,18 @@ class TestGetSnapshot(unittest.TestCase):
         snapshot = self.sim.get_snapshot()
         self.assertIsNone(snapshot["drivers"][0]["rid"])
 
+    def test_snapshot_driver_target_follows_request_status(self):
+        """Driver tx/ty point at pickup while assigned and at dropoff once picked."""
+        request = create_mock_request(1, px=3.0, py=4.0, dx=7.0, dy=8.0)
+        self.driver.assign_request(request, current_time=0)
+
+        row = self.sim.get_snapshot()["drivers"][0]
+        self.assertEqual((row["rid"], row["tx"], row["ty"]), (1, 3.0, 4.0))
+
+        self.driver.complete_pickup(1)
+        row = self.sim.get_snapshot()["drivers"][0]
+        self.assertEqual((row["rid"], row["tx"], row["ty"]), (1, 7.0, 8.0))
+
     def test_snapshot_is_json_serializable(self):
         """Snapshot can be serialized to JSON."""
         import json
@@ -550,6 +578,51 @@ class TestDeliverySimulationIntegration(unittest.TestCase):
         self.assertEqual(self.sim.time, 3)
         self.assertEqual(self.sim.served_count, 0)
 
+    def test_request_expires_only_after_timeout(self):
+        """A waiting request expires once its age exceeds the timeout, not at equality."""
+        from phase2.helpers_2.engine_helpers import expire_requests
+        request = create_mock_request(1, creation_time=0)
+        self.sim.requests.append(request)
+
+        self.sim.time = 5
+        expire_requests(self.sim)
+        self.assertEqual(request.status, "WAITING")
+
+        self.sim.time = 6
+        expire_requests(self.sim)
+        self.assertEqual(request.status, "EXPIRED")
+        self.assertEqual(self.sim.expired_count, 1)
+
+    def test_dropoff_updates_running_wait(self):
+        """Each delivery folds its wait (delivery time - creation time) into avg_wait."""
+        from phase2.helpers_2.engine_helpers import handle_dropoff
+        driver = self.drivers[0]
+        for time, created in ((4, 0), (10, 4)):
+            request = create_mock_request(time, creation_time=created)
+            driver.assign_request(request, created)
+            driver.complete_pickup(created)
+            self.sim.time = time
+            handle_dropoff(self.sim, driver)
+        self.assertEqual(self.sim.served_count, 2)
+        self.assertEqual(self.sim.avg_wait, 5.0)
+
+    def test_expire_pass_drops_finished_requests(self):
+        """Expired and delivered requests leave the requests list; in-flight ones stay in order."""
+        from phase2.helpers_2.engine_helpers import expire_requests
+        stale = create_mock_request(1, creation_time=0)
+        done = create_mock_request(2, creation_time=8)
+        done.status = "DELIVERED"
+        fresh = create_mock_request(3, creation_time=8)
+        picked = create_mock_request(4, creation_time=0)
+        picked.status = "PICKED"
+        self.sim.requests.extend([stale, done, fresh, picked])
+
+        self.sim.time = 10
+        expire_requests(self.sim)
+        self.assertEqual(self.sim.requests, [fresh, picked])
+        self.assertEqual(stale.status, "EXPIRED")
+        self.assertEqual(self.sim.expired_count, 1)
+
     def test_simulation_tracks_requests_count(self):
         """Simulation maintains requests list."""
         request = create_mock_request(1)